@@ -10,6 +10,7 @@ let python-with-flake8-plugins = pkgs.python3.withPackages (ps: with ps; [
   mccabe
   pytest
   pytest-cov
+  pytest-xdist
 ]);
 
 python-with-mkdocs = pkgs.python3.withPackages (ps: with ps; [
@@ -4,6 +4,12 @@ This module provides helper functions for calculating frame sampling rates
 to optimize video processing performance.
 """
 
+import time
+from typing import Callable
+
+PROGRESS_INTERVAL = 1 / 30
+"""Minimum seconds between throttled progress callbacks (~30 Hz)."""
+
 
 def calculate_frame_frequency(frame_rate: float, resolution: int) -> int:
     """Calculate how often to sample frames based on desired resolution.
@@ -13,7 +19,8 @@ def calculate_frame_frequency(frame_rate: float, resolution: int) -> int:
         resolution: Desired frames to process per second.
 
     Returns:
-        Frame interval (process every Nth frame).
+        Frame interval (process every Nth frame), at least 1 so that
+        resolutions above the frame rate sample every frame.
 
     Examples:
         ```python
@@ -26,4 +33,45 @@ def calculate_frame_frequency(frame_rate: float, resolution: int) -> int:
         print(interval)  # 10 (every 10th frame)
         ```
     """
-    return int(frame_rate / resolution)
+    return max(1, int(frame_rate / resolution))
+
+
+def throttle_progress(
+    on_progress: Callable[[int, int], None],
+    min_interval: float = PROGRESS_INTERVAL,
+) -> Callable[[int, int], None]:
+    """Wrap a progress callback so per-frame updates don't flood the UI.
+
+    The wrapped callback only fires when the integer percentage has changed
+    and at least ``min_interval`` seconds have passed since the last call.
+    The final update (``frames_processed >= total_frames``) is always
+    forwarded so displays end at 100%.
+
+    Args:
+        on_progress: Callback taking (frames_processed, total_frames).
+        min_interval: Minimum seconds between calls.
+
+    Returns:
+        Callback with the same signature that forwards throttled updates.
+
+    Examples:
+        ```python
+        progress = throttle_progress(lambda done, total: print(done, total))
+        for frame in range(1000):
+            progress(frame, 1000)  # prints at most ~30 times per second
+        ```
+    """
+    last_time = float("-inf")
+    last_percent = -1
+
+    def throttled(frames_processed: int, total_frames: int) -> None:
+        nonlocal last_time, last_percent
+        percent = frames_processed * 100 // total_frames if total_frames > 0 else 0
+        now = time.monotonic()
+        is_final = frames_processed >= total_frames
+        if not is_final and (percent == last_percent or now - last_time < min_interval):
+            return
+        last_time, last_percent = now, percent
+        on_progress(frames_processed, total_frames)
+
+    return throttled
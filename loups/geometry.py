@@ -21,10 +21,18 @@ Examples:
     ```
 """
 
-from collections import namedtuple
+from typing import NamedTuple
 
-Point = namedtuple("Point", "x, y")
-"""2D coordinate point with x and y attributes."""
 
-Size = namedtuple("Size", "height, width")
-"""Image dimensions with height and width attributes."""
+class Point(NamedTuple):
+    """2D coordinate point with x and y attributes."""
+
+    x: int
+    y: int
+
+
+class Size(NamedTuple):
+    """Image dimensions with height and width attributes."""
+
+    height: int
+    width: int
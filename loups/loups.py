@@ -36,11 +36,63 @@ import cv2 as cv
 import easyocr
 import numpy as np
 
+from .frame_utils import calculate_frame_frequency
 from .geometry import Point, Size
 from .match_template_scan import MatchTemplateScan
 
 logger = logging.getLogger(__name__)
 
+JERSEY_RE = re.compile(r"#\d+")
+"""Jersey number token (e.g. ``#12``) embedded in OCR text."""
+
+WHITESPACE_RE = re.compile(r"\s+")
+"""Runs of whitespace collapsed to a single space in batter names."""
+
+FRAME_SIGNATURE_SIZE = (32, 32)
+"""Size of the grayscale thumbnail compared by adaptive frame skipping."""
+
+ADAPTIVE_SKIP_THRESHOLD = 2.0
+"""Mean absolute signature difference below which a frame counts as unchanged."""
+
+ADAPTIVE_SKIP_MAX_FACTOR = 4
+"""Largest multiple of the sampling interval adaptive skipping stretches to."""
+
+
+def _frame_signature(frame: np.ndarray) -> np.ndarray:
+    """Downsample a BGR frame to a tiny grayscale signature for change detection.
+
+    Args:
+        frame: BGR video frame.
+
+    Returns:
+        float32 array of shape FRAME_SIGNATURE_SIZE.
+    """
+    gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+    small = cv.resize(gray, FRAME_SIGNATURE_SIZE, interpolation=cv.INTER_AREA)
+    return small.astype(np.float32)
+
+
+def _signature_difference(a: np.ndarray, b: np.ndarray) -> float:
+    """Mean absolute difference between two frame signatures (0-255 scale)."""
+    return cv.norm(a, b, cv.NORM_L1) / a.size
+
+
+def _leftmost_x(location) -> float:
+    """Get the x-coordinate of the leftmost point of an OCR bounding box.
+
+    Args:
+        location: EasyOCR box, either a list of points
+            ``[[x1, y1], [x2, y2], ...]`` or a flat ``(x1, y1, x2, y2)`` tuple.
+
+    Returns:
+        Smallest x-coordinate in the box.
+    """
+    # Check if it's a list of points or a flat tuple
+    if isinstance(location[0], (list, tuple)) and len(location[0]) >= 2:
+        return min(point[0] for point in location)
+    # Flat tuple: x-coordinates are at even indices
+    return min(location[0::2])
+
 
 class MilliSecond(float):
     """Custom millisecond type with YouTube chapter formatting.
@@ -90,16 +142,14 @@ class MilliSecond(float):
             print(ms.yt_format())  # "01:01:05"
             ```
         """
-        td = timedelta(milliseconds=self)
-
-        hours = td // timedelta(hours=1)
-        minutes = td // timedelta(minutes=1) % 60
-        seconds = td // timedelta(seconds=1) % 60
+        # One integer division to whole seconds, then split into H:M:S
+        minutes, seconds = divmod(int(self) // 1000, 60)
+        hours, minutes = divmod(minutes, 60)
 
         return (
-            f"{minutes:02.0f}:{seconds:02.0f}"
+            f"{minutes:02d}:{seconds:02d}"
             if hours == 0
-            else f"{hours:02.0f}:{minutes:02.0f}:{seconds:02.0f}"
+            else f"{hours:02d}:{minutes:02d}:{seconds:02d}"
         )
 
 
@@ -205,6 +255,7 @@ class Loups:
         resolution: int = 3,
         on_batter_found: Optional[Callable[[FrameBatterInfo], None]] = None,
         on_progress: Optional[Callable[[int, int], None]] = None,
+        adaptive_skip: bool = False,
     ) -> None:
         """Initialize Loups video scanner.
 
@@ -221,6 +272,10 @@ class Loups:
                 Signature: callback(batter_info: FrameBatterInfo) -> None
             on_progress: Optional callback for progress updates.
                 Signature: callback(frames_processed: int, total_frames: int) -> None
+            adaptive_skip: Reuse the previous result for sampled frames that look
+                unchanged and progressively widen the sampling interval (up to
+                ADAPTIVE_SKIP_MAX_FACTOR times) until the picture changes.
+                Default: False (uniform sampling).
 
         Examples:
             ```python
@@ -246,6 +301,9 @@ class Loups:
         self.search_quadrant = "bottomleft"
         self.on_batter_found = on_batter_found
         self.on_progress = on_progress
+        self.adaptive_skip = adaptive_skip
+        self._gray_frame: Optional[np.ndarray] = None
+        self._match_buffer: Optional[np.ndarray] = None
 
     @property
     def method(self) -> str:
@@ -315,11 +373,15 @@ class Loups:
         """Get or initialize the shared EasyOCR reader.
 
         Lazy initialization pattern to avoid loading OCR models until needed.
+        The reader is stored on the class, so the models are loaded once per
+        process and shared by every Loups instance.
 
         Returns:
             Initialized easyocr.Reader instance for English text.
         """
-        return easyocr.Reader(["en"]) if cls._reader is None else cls._reader
+        if cls._reader is None:
+            cls._reader = easyocr.Reader(["en"])
+        return cls._reader
 
     def create_capture(self) -> cv.VideoCapture:
         """Create OpenCV VideoCapture for the video file.
@@ -348,8 +410,6 @@ class Loups:
         Returns:
             Number of frames to skip between samples (e.g., 10 means every 10th frame).
         """
-        from .frame_utils import calculate_frame_frequency
-
         return calculate_frame_frequency(self.frame_rate, self.resolution)
 
     def timestamp(self) -> float:
@@ -363,14 +423,23 @@ class Loups:
     def match_template_scan(self) -> MatchTemplateScan:
         """Perform template matching on current frame.
 
+        The grayscale conversion and the matchTemplate result write into
+        buffers this instance reuses across frames, so read the scan's
+        results before scanning the next frame.
+
         Returns:
             MatchTemplateScan object containing match results.
         """
+        self._gray_frame = cv.cvtColor(
+            self.frame, cv.COLOR_BGR2GRAY, dst=self._gray_frame
+        )
         scan = MatchTemplateScan(
-            image=cv.cvtColor(self.frame, cv.COLOR_BGR2GRAY),
+            image=self._gray_frame,
             template=self.template,
             method=self.method,
+            result_buffer=self._match_buffer,
         )
+        self._match_buffer = scan.match
         return scan
 
     def new_batter(
@@ -387,7 +456,7 @@ class Loups:
             True if this frame represents a new batter, False otherwise.
         """
         new_batter_frame = self.prev_frame_is_not_batter(res)
-        logger.debug(f"{new_batter_frame=}")
+        logger.debug("new_batter_frame=%r", new_batter_frame)
 
         prev_batter_frame_timestamp = self.prev_batter_frame_timestamp(res)
         try:
@@ -471,53 +540,29 @@ class Loups:
         ocr = self.get_reader().readtext(image_to_scan)
         logger.debug(f"{ocr=}")
 
-        # Filter by confidence threshold
-        filtered_ocr = [
-            (location, text, score)
-            for location, text, score in ocr
-            if score > threshold
-        ]
-
-        # Sort by x-coordinate (left-to-right) using the leftmost point
-        # OCR location can be:
-        # - [[top-left], [top-right], [bottom-right], [bottom-left]]
-        #   (list of points)
-        # - (x1, y1, x2, y2) (tuple of coordinates)
-        # For left-to-right reading, sort by x-coordinate of leftmost point
-        def get_leftmost_x(item):
-            location = item[0]
-            # Check if it's a list of points or a flat tuple
-            if isinstance(location[0], (list, tuple)) and len(location[0]) >= 2:
-                # List of points: [[x1, y1], [x2, y2], ...]
-                return min(point[0] for point in location)
-            else:
-                # Flat tuple: (x1, y1, x2, y2)
-                # x-coordinates are at even indices
-                return min(location[i] for i in range(0, len(location), 2))
-
-        sorted_ocr = sorted(filtered_ocr, key=get_leftmost_x)
-
-        # Extract just the text strings after sorting
-        text = [text for location, text, score in sorted_ocr]
-
-        # Extract jersey numbers and name parts from all elements
-        jersey_pattern = r"#\d+"
-
-        # Collect all jersey numbers from all text elements
-        # (now in left-to-right order)
-        all_jerseys = [
-            jersey for item in text for jersey in re.findall(jersey_pattern, item)
-        ]
-
-        # Collect all non-jersey text parts
-        # (remove jerseys, normalize spaces, preserve left-to-right order)
-        all_name_parts = [
-            re.sub(r"\s+", " ", re.sub(jersey_pattern, "", item).strip())
-            for item in text
-        ]
-
-        # Filter out empty strings
-        all_name_parts = [part for part in all_name_parts if part]
+        # Split results into parallel arrays so filtering and sorting are
+        # single NumPy operations instead of passes over (box, text, score)
+        texts = [text for _, text, _ in ocr]
+        x_mins = np.array([_leftmost_x(location) for location, _, _ in ocr])
+        scores = np.array([score for _, _, score in ocr], dtype=np.float64)
+
+        # Filter by confidence threshold, then sort left-to-right by the
+        # leftmost point (stable, so ties keep OCR order)
+        keep = np.flatnonzero(scores > threshold)
+        order = keep[np.argsort(x_mins[keep], kind="stable")]
+        text = [texts[i] for i in order]
+
+        # Split every text element into jersey numbers and name parts in one
+        # left-to-right pass (remove jerseys, normalize spaces, drop empties)
+        all_name_parts = []
+        all_jerseys = []
+        for item in text:
+            if "#" in item:
+                all_jerseys.extend(JERSEY_RE.findall(item))
+                item = JERSEY_RE.sub("", item)
+            part = WHITESPACE_RE.sub(" ", item.strip())
+            if part:
+                all_name_parts.append(part)
 
         # Combine: name parts first (in left-to-right order), then jersey numbers
         result = " ".join(all_name_parts + all_jerseys)
@@ -560,6 +605,14 @@ class Loups:
             ```
         """
         frame_count = 0
+        # Constant for the whole video, so compute it once outside the loop
+        frame_frequency = self.frame_frequency()
+        max_stride = frame_frequency * ADAPTIVE_SKIP_MAX_FACTOR
+        stride = frame_frequency
+        # Track the next sampled frame instead of taking a modulo per frame
+        next_keep_frame = frame_frequency
+        # Signature of the last fully processed frame (adaptive_skip only)
+        reference = None
 
         # Initalize a list to collect FrameBatterInfo objects
         frames = []
@@ -570,10 +623,9 @@ class Loups:
                 break
 
             frame_count += 1
-            logger.debug(f"{frame_count=}")
-            frame_frequency = self.frame_frequency()
-            keep_frame = frame_count % frame_frequency == 0
-            logger.debug(f"{keep_frame=}")
+            logger.debug("frame_count=%r", frame_count)
+            keep_frame = frame_count == next_keep_frame
+            logger.debug("keep_frame=%r", keep_frame)
 
             if keep_frame:
                 ret, self.frame = self.capture.retrieve()
@@ -582,23 +634,47 @@ class Loups:
                 # Record timestamp of frame
                 ms = MilliSecond(self.timestamp())
 
-                # Search for template in frame
-                is_match, score, match_top_left = self.match_template_scan().result
-
-                # Does this frame contain a new batter
-                new_batter = self.new_batter(frames, ms) if is_match else False
-                new_batter_name = (
-                    self.batter_name(match_top_left) if new_batter else None
-                )
-
-                frame_batter_info = FrameBatterInfo(
-                    ms=ms,
-                    match_score=score,
-                    is_batter=is_match,
-                    new_batter=new_batter,
-                    batter_name=new_batter_name,
-                )
-                logger.info(f"{frame_batter_info=}")
+                # Skip further ahead while the picture stays the same and fall
+                # back to the regular interval as soon as it changes
+                unchanged = False
+                if self.adaptive_skip:
+                    signature = _frame_signature(self.frame)
+                    unchanged = (
+                        reference is not None
+                        and _signature_difference(signature, reference)
+                        < ADAPTIVE_SKIP_THRESHOLD
+                    )
+                    if unchanged:
+                        stride = min(stride * 2, max_stride)
+                    else:
+                        stride = frame_frequency
+                        reference = signature
+                next_keep_frame += stride
+
+                if unchanged:
+                    # Same picture as the last processed frame: reuse its result
+                    frame_batter_info = frames[-1]._replace(
+                        ms=ms, new_batter=False, batter_name=None
+                    )
+                    new_batter = False
+                else:
+                    # Search for template in frame
+                    is_match, score, match_top_left = self.match_template_scan().result
+
+                    # Does this frame contain a new batter
+                    new_batter = self.new_batter(frames, ms) if is_match else False
+                    new_batter_name = (
+                        self.batter_name(match_top_left) if new_batter else None
+                    )
+
+                    frame_batter_info = FrameBatterInfo(
+                        ms=ms,
+                        match_score=score,
+                        is_batter=is_match,
+                        new_batter=new_batter,
+                        batter_name=new_batter_name,
+                    )
+                logger.info("frame_batter_info=%r", frame_batter_info)
                 frames.append(frame_batter_info)
 
                 # Call callback if a new batter was found
@@ -2,13 +2,13 @@
 
 import logging
 from collections import namedtuple
-from functools import cached_property
-from typing import Literal, NamedTuple, Union
+from types import MappingProxyType
+from typing import Literal, Mapping, NamedTuple, Optional, Union
 
 import cv2 as cv
 import numpy as np
 
-from .geometry import Point, Size
+from .geometry import Point
 
 logger = logging.getLogger(__name__)
 
@@ -41,39 +41,103 @@ class MatchDefault(NamedTuple):
     optimal_function: Union[Literal["min"], Literal["max"]]
 
 
+_METHOD_DEFAULT: Mapping[str, MatchDefault] = MappingProxyType(
+    {
+        "TM_SQDIFF": MatchDefault(threshold=None, optimal_function="min"),
+        "TM_SQDIFF_NORMED": MatchDefault(threshold=None, optimal_function="min"),
+        "TM_CCORR": MatchDefault(threshold=None, optimal_function="max"),
+        "TM_CCORR_NORMED": MatchDefault(threshold=None, optimal_function="max"),
+        "TM_CCOEFF": MatchDefault(threshold=None, optimal_function="max"),
+        "TM_CCOEFF_NORMED": MatchDefault(threshold=0.53, optimal_function="max"),
+    }
+)
+"""Read-only default configuration for each template matching method."""
+
+
+_SUPPORTED_DTYPES = (np.dtype(np.uint8), np.dtype(np.float32))
+"""Input dtypes cv.matchTemplate handles without conversion."""
+
+
+def _best_index(match_result: np.ndarray, optimal_function: str) -> int:
+    """Get the flat index of the best score in a matchTemplate result.
+
+    Args:
+        match_result: Result array from cv.matchTemplate.
+        optimal_function: "min" or "max", the extremum the method optimizes.
+
+    Returns:
+        Flat index of the first minimum or maximum.
+    """
+    if optimal_function == "max":
+        return int(match_result.argmax())
+    return int(match_result.argmin())
+
+
 class MatchTemplateScan:
     """Scan an image for the existence of a template pattern."""
 
-    def __init__(self, image: np.ndarray, template: np.ndarray, method: str):
+    def __init__(
+        self,
+        image: np.ndarray,
+        template: np.ndarray,
+        method: str,
+        coarse_scale: int = 1,
+        result_buffer: Optional[np.ndarray] = None,
+    ):
         """Initialize a template matching scanner.
 
         Args:
             image: Video frame or image to search (grayscale numpy array).
             template: Template pattern to search for (grayscale numpy array).
             method: OpenCV template matching method name (e.g., "TM_CCOEFF_NORMED").
+            coarse_scale: When greater than 1, locate the match on copies of
+                the image and template downscaled by this factor, then refine
+                it at full resolution in a small window around the coarse
+                peak. Cuts matching work roughly by ``coarse_scale ** 2`` but
+                can miss matches whose detail does not survive downscaling.
+                Default: 1 (exhaustive full-resolution search).
+            result_buffer: Float32 array of shape ``result_shape`` for
+                cv.matchTemplate to write into. The caller owns it and can
+                pass the same buffer for every frame of a scan to avoid a new
+                allocation per frame; ``match`` then aliases it. Default:
+                None (this scanner allocates its own result array).
 
         Note:
+            cv.matchTemplate works on uint8 or float32 inputs of the same type.
+            Non-contiguous inputs are made C-contiguous once here, and other or
+            mismatched dtypes are converted to float32, so OpenCV never has to
+            copy them internally. Already-suitable arrays are used as-is.
+
             See https://docs.opencv.org/4.x/df/dfb/group__imgproc__object.html
         """
+        image = np.ascontiguousarray(image)
+        template = np.ascontiguousarray(template)
+        if image.dtype != template.dtype or image.dtype not in _SUPPORTED_DTYPES:
+            image = image.astype(np.float32)
+            template = template.astype(np.float32)
+
         self.image = image
         self.template = template
         self.method = method
+        self.coarse_scale = coarse_scale
+        self._result_buffer = result_buffer
+        self._method_int = getattr(cv, method, None)
+        self._match = None
+
+        # Dimensions used per result, cached as plain ints
+        self._image_h, self._image_w = image.shape[:2] if image.ndim >= 2 else (0, 0)
+        self._template_h, self._template_w = (
+            template.shape[:2] if template.ndim >= 2 else (0, 0)
+        )
 
     @property
-    def method_default(self) -> dict[str, MatchDefault]:
+    def method_default(self) -> Mapping[str, MatchDefault]:
         """Get default configuration for all template matching methods.
 
         Returns:
-            Dictionary mapping method names to their default configurations.
+            Read-only mapping of method names to their default configurations.
         """
-        return {
-            "TM_SQDIFF": MatchDefault(threshold=None, optimal_function="min"),
-            "TM_SQDIFF_NORMED": MatchDefault(threshold=None, optimal_function="min"),
-            "TM_CCORR": MatchDefault(threshold=None, optimal_function="max"),
-            "TM_CCORR_NORMED": MatchDefault(threshold=None, optimal_function="max"),
-            "TM_CCOEFF": MatchDefault(threshold=None, optimal_function="max"),
-            "TM_CCOEFF_NORMED": MatchDefault(threshold=0.53, optimal_function="max"),
-        }
+        return _METHOD_DEFAULT
 
     @property
     def method_attr(self) -> int:
@@ -81,8 +145,13 @@ class MatchTemplateScan:
 
         Returns:
             Integer constant from cv2 module (e.g., cv.TM_CCOEFF_NORMED).
+
+        Raises:
+            AttributeError: If cv2 has no constant with the method name.
         """
-        return getattr(cv, self.method)
+        if self._method_int is None:
+            raise AttributeError(f"cv2 has no template matching method {self.method!r}")
+        return self._method_int
 
     @property
     def cfg(self) -> MatchConfig:
@@ -95,14 +164,91 @@ class MatchTemplateScan:
             image=self.image, templ=self.template, method=self.method_attr
         )
 
-    @cached_property
-    def match(self) -> cv.matchTemplate:
+    @property
+    def result_shape(self) -> Optional[tuple[int, int]]:
+        """Get the shape of the cv.matchTemplate output for this image/template.
+
+        Returns:
+            (rows, cols) of the result array, or None if the inputs are not a
+            2D image at least as large as a 2D template.
+        """
+        if self.image.ndim != 2 or self.template.ndim != 2:
+            return None
+        rows = self._image_h - self._template_h + 1
+        cols = self._image_w - self._template_w + 1
+        if rows <= 0 or cols <= 0:
+            return None
+        return rows, cols
+
+    def _ensure_match(self) -> np.ndarray:
+        """Run cv.matchTemplate once, writing into result_buffer if given.
+
+        No separate FFT path is needed for large templates: OpenCV already
+        switches to DFT-based cross-correlation internally once the template
+        is big enough for it to pay off.
+
+        Returns:
+            Result array from cv.matchTemplate showing match scores.
+        """
+        if self._match is None:
+            # OpenCV allocates when no buffer was given or it has the wrong
+            # shape, and still reports any size/dimension errors
+            self._match = cv.matchTemplate(
+                **self.cfg._asdict(), result=self._result_buffer
+            )
+        return self._match
+
+    def _use_coarse_search(self) -> bool:
+        """Check whether coarse-to-fine matching applies to these inputs."""
+        return (
+            self.coarse_scale > 1
+            and self.result_shape is not None
+            and min(self._template_h, self._template_w) >= self.coarse_scale
+        )
+
+    def _refined_match(self, optimal_function: str) -> tuple[np.ndarray, Point]:
+        """Match at reduced resolution, then rescore around the coarse peak.
+
+        Args:
+            optimal_function: "min" or "max", the extremum the method optimizes.
+
+        Returns:
+            Tuple of (full-resolution scores for the refinement window,
+            top-left corner of that window in image coordinates).
+        """
+        scale = self.coarse_scale
+        small_image, small_template = (
+            cv.resize(
+                array, None, fx=1 / scale, fy=1 / scale, interpolation=cv.INTER_AREA
+            )
+            for array in (self.image, self.template)
+        )
+        coarse = cv.matchTemplate(small_image, small_template, self.method_attr)
+        coarse_y, coarse_x = divmod(
+            _best_index(coarse, optimal_function), coarse.shape[1]
+        )
+
+        # Pad the window by one coarse pixel on each side to absorb rounding
+        x0 = max((coarse_x - 1) * scale, 0)
+        y0 = max((coarse_y - 1) * scale, 0)
+        x1 = min((coarse_x + 1) * scale + self._template_w, self._image_w)
+        y1 = min((coarse_y + 1) * scale + self._template_h, self._image_h)
+        window = self.image[y0:y1, x0:x1]
+
+        return cv.matchTemplate(window, self.template, self.method_attr), Point(x0, y0)
+
+    @property
+    def match(self) -> np.ndarray:
         """Perform template matching operation.
 
+        The computation runs once per scanner. When a result_buffer was
+        passed in, the returned array is that buffer, so read it before
+        reusing the buffer for another scan.
+
         Returns:
             Result array from cv.matchTemplate showing match scores.
         """
-        return cv.matchTemplate(**self.cfg._asdict())
+        return self._ensure_match()
 
     @property
     def result(self) -> MatchTemplateResult:
@@ -116,7 +262,7 @@ class MatchTemplateScan:
         in_quadrant = self.match_quadrant(top_left_loc)
 
         is_match = meets_threshold and in_quadrant
-        logger.debug(f"{is_match=}")
+        logger.debug("is_match=%r", is_match)
 
         return MatchTemplateResult(is_match, score, top_left_loc)
 
@@ -129,21 +275,11 @@ class MatchTemplateScan:
         Returns:
             True if match is in bottom-left quadrant, False otherwise.
         """
-        template_size = Size(*self.template.shape)
-        logger.debug(f"{template_size=}")
-
-        match_bottom_left = Point(
-            match_top_left.x, match_top_left.y + template_size.height
-        )
-        logger.debug(f"{match_bottom_left=}")
-
-        image_size = Size(*self.image.shape)
-        logger.debug(f"{image_size=}")
-
-        is_bottom_left_quadrant = (match_bottom_left.x < 0.5 * image_size.width) and (
-            match_bottom_left.y > 0.5 * image_size.height
+        # Integer form of: x < width / 2 and y + template_height > height / 2
+        is_bottom_left_quadrant = (2 * match_top_left.x < self._image_w) & (
+            2 * (match_top_left.y + self._template_h) > self._image_h
         )
-        logger.debug(f"{is_bottom_left_quadrant=}")
+        logger.debug("is_bottom_left_quadrant=%r", is_bottom_left_quadrant)
 
         return is_bottom_left_quadrant
 
@@ -156,18 +292,24 @@ class MatchTemplateScan:
         Returns:
             Tuple of (meets_threshold, score, top_left_location).
         """
-        default = self.method_default.get(self.method)
-        logger.debug(f"{default=}")
-        min_val, max_val, min_loc, max_loc = cv.minMaxLoc(self.match)
-
-        match default.optimal_function:
-            case "max":
-                score = max_val
-                is_match = max_val >= default.threshold
-                top_left_loc = Point(*max_loc)
-            case "min":
-                score = min_val
-                is_match = min_val <= default.threshold
-                top_left_loc = Point(*min_loc)
+        default = _METHOD_DEFAULT.get(self.method)
+        logger.debug("default=%r", default)
+        if self._use_coarse_search():
+            match_result, offset = self._refined_match(default.optimal_function)
+        else:
+            match_result, offset = self.match, Point(0, 0)
+
+        # Only reduce for the extremum this method optimizes for
+        index = _best_index(match_result, default.optimal_function)
+        score = float(match_result.flat[index])
+        if default.optimal_function == "max":
+            is_match = score >= default.threshold
+        else:
+            is_match = score <= default.threshold
+
+        # Flat index -> (x, y); argmax/argmin pick the first extremum in
+        # row-major order, like cv.minMaxLoc
+        y, x = divmod(index, match_result.shape[1])
+        top_left_loc = Point(offset.x + x, offset.y + y)
 
         return is_match, score, top_left_loc
@@ -1,17 +1,60 @@
 """Extract thumbnail images from video files using SSIM-based frame matching."""
 
 import logging
+import queue
+import threading
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, NamedTuple, Optional
+from typing import Callable, Iterator, NamedTuple, Optional, Union
 
 import cv2 as cv
 import numpy as np
-from skimage.metrics import structural_similarity as ssim
 
-from .frame_utils import calculate_frame_frequency
+from .frame_utils import calculate_frame_frequency, throttle_progress
 
 logger = logging.getLogger(__name__)
 
+SSIM_KERNEL_SIZE = (7, 7)
+"""Uniform window for local SSIM statistics (skimage's default win_size=7)."""
+
+SSIM_COV_NORM = 49 / 48
+"""Sample-covariance correction for a 7x7 window, as skimage applies by default."""
+
+SSIM_BORDER = 3
+"""Pixels cropped from each edge before averaging, where the window is clipped."""
+
+SSIM_C1 = (0.01 * 255) ** 2
+"""SSIM luminance stabilizer for 8-bit images."""
+
+SSIM_C2 = (0.03 * 255) ** 2
+"""SSIM contrast stabilizer for 8-bit images."""
+
+NCC_PREFILTER_THRESHOLD = 0.3
+"""Suggested prefilter_threshold: lower NCC with the template skips SSIM scoring."""
+
+MIN_FRAME_STDDEV = 5.0
+"""Frames with a lower grayscale standard deviation are treated as flat."""
+
+FRAME_QUEUE_SIZE = 8
+"""Maximum decoded frames buffered between the decode and SSIM stages."""
+
+SSIM_CASCADE_MARGIN = 0.1
+"""How far below threshold a downscaled SSIM score still gets a full-size check."""
+
+
+_IMREAD_FLAGS = {
+    (1, False): cv.IMREAD_COLOR,
+    (1, True): cv.IMREAD_GRAYSCALE,
+    (2, False): cv.IMREAD_REDUCED_COLOR_2,
+    (2, True): cv.IMREAD_REDUCED_GRAYSCALE_2,
+    (4, False): cv.IMREAD_REDUCED_COLOR_4,
+    (4, True): cv.IMREAD_REDUCED_GRAYSCALE_4,
+    (8, False): cv.IMREAD_REDUCED_COLOR_8,
+    (8, True): cv.IMREAD_REDUCED_GRAYSCALE_8,
+}
+"""cv.imread flags by (reduce factor, grayscale)."""
+
 
 class ThumbnailResult(NamedTuple):
     """Result from a thumbnail extraction operation.
@@ -31,35 +74,84 @@ class ThumbnailResult(NamedTuple):
     output_path: Path
 
 
+class TemplateStats(NamedTuple):
+    """Per-template SSIM statistics that stay constant during a scan.
+
+    Attributes:
+        gray: Grayscale template image.
+        gray_f32: Grayscale template as float32.
+        mu: Local mean of the template.
+        mu_sq: Square of the local mean.
+        sigma_sq: Local sample variance of the template.
+    """
+
+    gray: np.ndarray
+    gray_f32: np.ndarray
+    mu: np.ndarray
+    mu_sq: np.ndarray
+    sigma_sq: np.ndarray
+
+
 class ThumbnailExtractor:
     """Extract thumbnail frames from videos using SSIM-based template matching."""
 
     def __init__(
         self,
         video_path: Path,
-        template_path: Optional[Path] = None,
+        template_path: Optional[Union[Path, np.ndarray]] = None,
         resolution: int = 3,
         scan_duration: int = 120,
         threshold: float = 0.8,
+        ssim_width: Optional[int] = None,
+        hw_accel: bool = False,
     ):
         """
         Initialize ThumbnailExtractor.
 
         Args:
             video_path: Path to video file
-            template_path: Path to template image (uses default if None)
+            template_path: Path to template image or a loaded image (uses
+                default if None)
             resolution: Frames to check per second (matches Loups)
             scan_duration: Maximum seconds to scan from video start
             threshold: Minimum SSIM score to accept (0.0-1.0)
+            ssim_width: Scan at most this many pixels wide; frames are scored
+                against a downscaled template first (None scans at full size)
+            hw_accel: Prefer a hardware video decoder (see open_video_capture).
+                Off by default because some VAAPI/NVDEC setups fail to decode
         """
         self.video_path = video_path
-        self.template = load_template(template_path)
+        self.template = load_template(template_path, grayscale=True)
         self.resolution = resolution
         self.scan_duration = scan_duration
         self.threshold = threshold
-        self.capture = cv.VideoCapture(str(video_path))
+        self.template_stats = compute_template_stats(self.template)
+        self.scan_stats = self.template_stats
+        if ssim_width is not None and ssim_width < self.template.shape[1]:
+            # Let the image decoder do the power-of-two part of the shrink
+            width = self.template.shape[1]
+            reduce = max(f for f in (1, 2, 4, 8) if width >= ssim_width * f)
+            small = load_template(template_path, grayscale=True, reduce=reduce)
+            self.scan_stats = compute_template_stats(shrink_to_width(small, ssim_width))
+        self.capture = open_video_capture(video_path, hw_accel=hw_accel)
         self.frame_rate = self.capture.get(cv.CAP_PROP_FPS)
 
+    def __enter__(self) -> "ThumbnailExtractor":
+        """Enter a context that releases the video capture on exit.
+
+        Returns:
+            Self.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Release the video capture when leaving the context."""
+        self.release()
+
+    def release(self) -> None:
+        """Release the underlying video capture and its decoder resources."""
+        self.capture.release()
+
     def frame_frequency(self) -> int:
         """Calculate frame sampling interval based on resolution.
 
@@ -69,6 +161,35 @@ class ThumbnailExtractor:
         return calculate_frame_frequency(self.frame_rate, self.resolution)
 
 
+def open_video_capture(video_path: Path, hw_accel: bool = False) -> cv.VideoCapture:
+    """
+    Open a video for decoding, optionally preferring a hardware decoder.
+
+    With hw_accel the FFmpeg backend is asked for VIDEO_ACCELERATION_ANY,
+    which uses VAAPI/NVDEC/VideoToolbox/D3D11 if present and silently decodes
+    in software otherwise. If FFmpeg cannot open the file, OpenCV's default
+    backend selection is used instead.
+
+    Args:
+        video_path: Path to video file
+        hw_accel: Request hardware-accelerated decoding
+
+    Returns:
+        Video capture for the file
+    """
+    if hw_accel:
+        capture = cv.VideoCapture(
+            str(video_path),
+            cv.CAP_FFMPEG,
+            [cv.CAP_PROP_HW_ACCELERATION, cv.VIDEO_ACCELERATION_ANY],
+        )
+        if capture.isOpened():
+            return capture
+        capture.release()
+
+    return cv.VideoCapture(str(video_path))
+
+
 def get_default_thumbnail_template() -> Path:
     """Get path to bundled default thumbnail template.
 
@@ -78,26 +199,69 @@ def get_default_thumbnail_template() -> Path:
     return Path(__file__).parent / "data" / "thumbnail_template.png"
 
 
-def load_template(template_path: Optional[Path] = None) -> np.ndarray:
+@lru_cache(maxsize=4)
+def _load_template_cached(
+    path: str, mtime: float, grayscale: bool, reduce: int
+) -> np.ndarray:
+    """Decode a template image, cached by resolved path and modification time.
+
+    The returned array is shared between callers, so it is made read-only.
+    """
+    template = cv.imread(path, _IMREAD_FLAGS[reduce, grayscale])
+    if template is not None:
+        template.flags.writeable = False
+    return template
+
+
+def load_template(
+    template_path: Optional[Union[Path, np.ndarray]] = None,
+    grayscale: bool = False,
+    reduce: int = 1,
+) -> np.ndarray:
     """
     Load thumbnail template, using default if not specified.
 
+    Decoded templates are cached, so repeated extractions with the same
+    (unchanged) template file skip the file read and PNG decode. A template
+    that is already in memory is used without any file round trip.
+
     Args:
-        template_path: Path to template image (None for default)
+        template_path: Path to template image, an already loaded BGR or
+            grayscale image, or None for the default
+        grayscale: Decode directly to a single-channel grayscale image
+        reduce: Downscale by 1, 2, 4 or 8 while decoding (IMREAD_REDUCED_*)
 
     Returns:
-        Template image as numpy array
+        Template image as a numpy array (BGR unless grayscale); read-only
+        when decoded from a file
 
     Raises:
         FileNotFoundError: If template file doesn't exist
+        ValueError: If reduce is not 1, 2, 4 or 8
     """
+    if (reduce, grayscale) not in _IMREAD_FLAGS:
+        raise ValueError(f"reduce must be 1, 2, 4 or 8, got {reduce}")
+
+    if isinstance(template_path, np.ndarray):
+        template = template_path
+        if grayscale and template.ndim == 3:
+            template = cv.cvtColor(template, cv.COLOR_BGR2GRAY)
+        if reduce > 1:
+            scale = 1 / reduce
+            template = cv.resize(
+                template, None, fx=scale, fy=scale, interpolation=cv.INTER_AREA
+            )
+        return template
+
     if template_path is None:
         template_path = get_default_thumbnail_template()
 
     if not template_path.exists():
         raise FileNotFoundError(f"Template not found: {template_path}")
 
-    return cv.imread(str(template_path))
+    return _load_template_cached(
+        str(template_path.resolve()), template_path.stat().st_mtime, grayscale, reduce
+    )
 
 
 def generate_default_output_path(video_path: Path) -> Path:
@@ -118,38 +282,333 @@ def generate_default_output_path(video_path: Path) -> Path:
     return Path.cwd() / f"{stem}-thumbnail.jpg"
 
 
-def calculate_ssim(frame: np.ndarray, template: np.ndarray) -> float:
+def shrink_to_width(image: np.ndarray, width: int) -> np.ndarray:
+    """
+    Downscale an image to a given width, keeping its aspect ratio.
+
+    Args:
+        image: Image as numpy array
+        width: Target width in pixels
+
+    Returns:
+        Resized image (INTER_AREA), or the image itself if it is not wider
+    """
+    height, image_width = image.shape[:2]
+    if image_width <= width:
+        return image
+    size = (width, max(1, round(height * width / image_width)))
+    return cv.resize(image, size, interpolation=cv.INTER_AREA)
+
+
+def _window_blur(image: np.ndarray, dst: Optional[np.ndarray] = None) -> np.ndarray:
+    """Apply the SSIM local-statistics window to an image."""
+    # Running-sum box filter: constant cost per pixel
+    return cv.boxFilter(image, -1, SSIM_KERNEL_SIZE, dst=dst)
+
+
+def compute_template_stats(template: np.ndarray) -> TemplateStats:
+    """
+    Precompute the template side of the SSIM formula.
+
+    The template never changes during a scan, so its grayscale conversion,
+    local mean and local variance only need to be computed once.
+
+    Args:
+        template: Template image as BGR or grayscale numpy array
+
+    Returns:
+        TemplateStats for use with calculate_ssim
+    """
+    gray = template if template.ndim == 2 else cv.cvtColor(template, cv.COLOR_BGR2GRAY)
+    gray_f32 = gray.astype(np.float32)
+    mu = _window_blur(gray_f32)
+    mu_sq = mu * mu
+    sigma_sq = (_window_blur(gray_f32 * gray_f32) - mu_sq) * SSIM_COV_NORM
+    return TemplateStats(gray, gray_f32, mu, mu_sq, sigma_sq)
+
+
+def prepare_frame(
+    frame: np.ndarray,
+    template: TemplateStats,
+    gray_buffer: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Convert a video frame to grayscale at template size.
+
+    Args:
+        frame: Video frame as BGR numpy array
+        template: Precomputed TemplateStats
+        gray_buffer: Reusable uint8 array of the frame's height and width for
+            the full-size grayscale intermediate (None allocates one)
+
+    Returns:
+        Grayscale uint8 frame with the same shape as the template
+    """
+    # Convert to grayscale first so the resize only touches one channel
+    frame_gray = cv.cvtColor(frame, cv.COLOR_BGR2GRAY, dst=gray_buffer)
+
+    # Resize frame to match template dimensions (INTER_AREA antialiases shrinks)
+    height, width = template.gray.shape
+    return cv.resize(frame_gray, (width, height), interpolation=cv.INTER_AREA)
+
+
+def is_flat_frame(frame_gray: np.ndarray, min_stddev: float = MIN_FRAME_STDDEV) -> bool:
+    """
+    Check whether a prepared frame is visually flat (e.g. a black intro).
+
+    Args:
+        frame_gray: Grayscale frame from prepare_frame
+        min_stddev: Standard deviation below which the frame counts as flat
+
+    Returns:
+        True if the frame has (almost) no structure to compare
+    """
+    _, stddev = cv.meanStdDev(frame_gray)
+    return stddev[0, 0] < min_stddev
+
+
+def calculate_ncc(frame_gray: np.ndarray, template: TemplateStats) -> float:
+    """
+    Calculate normalized cross-correlation between a prepared frame and template.
+
+    Much cheaper than SSIM, so it is used to reject obviously non-matching
+    frames before scoring them. Undefined (reported as 0.0) when either image
+    is flat.
+
+    Args:
+        frame_gray: Grayscale frame from prepare_frame
+        template: Precomputed TemplateStats
+
+    Returns:
+        Correlation coefficient (-1.0 to 1.0)
+    """
+    return float(cv.matchTemplate(frame_gray, template.gray, cv.TM_CCOEFF_NORMED)[0, 0])
+
+
+def _ssim_buffers(
+    shape: tuple[int, ...], scratch: Optional[dict]
+) -> tuple[np.ndarray, ...]:
+    """Get the five float32 work arrays for a frame, reusing them from scratch."""
+    buffers = scratch.get(shape) if scratch is not None else None
+    if buffers is None:
+        buffers = tuple(np.empty(shape, dtype=np.float32) for _ in range(5))
+        if scratch is not None:
+            scratch[shape] = buffers
+    return buffers
+
+
+def calculate_ssim_gray(
+    frame_gray: np.ndarray,
+    template: TemplateStats,
+    scratch: Optional[dict] = None,
+) -> float:
+    """
+    Calculate SSIM between a prepared grayscale frame and the template.
+
+    Blurs write into, and the closed-form combine works in place on, five
+    float32 work arrays, so no temporary array is allocated for an
+    intermediate term.
+
+    Args:
+        frame_gray: Grayscale frame from prepare_frame
+        template: Precomputed TemplateStats
+        scratch: Dict in which the work arrays are kept between calls, keyed
+            by frame shape (None allocates them for this call only)
+
+    Returns:
+        SSIM score (0.0 to 1.0, where 1.0 is perfect match)
+    """
+    frame_f32, mu_f, sigma_ft, sigma_f_sq, mu_f_sq = _ssim_buffers(
+        frame_gray.shape, scratch
+    )
+    frame_f32[...] = frame_gray
+
+    # Frame-side local statistics (mu_f_sq doubles as scratch until it is set)
+    _window_blur(frame_f32, dst=mu_f)
+    np.multiply(frame_f32, template.gray_f32, out=mu_f_sq)
+    _window_blur(mu_f_sq, dst=sigma_ft)
+    sigma_ft -= np.multiply(mu_f, template.mu, out=mu_f_sq)
+    np.multiply(frame_f32, frame_f32, out=frame_f32)
+    _window_blur(frame_f32, dst=sigma_f_sq)
+    sigma_f_sq -= np.multiply(mu_f, mu_f, out=mu_f_sq)
+
+    # numerator = (2 * mu_f * mu_t + C1) * (2 * sigma_ft + C2)
+    numerator = np.multiply(mu_f, template.mu, out=mu_f)
+    numerator *= 2
+    numerator += SSIM_C1
+    sigma_ft *= 2 * SSIM_COV_NORM
+    sigma_ft += SSIM_C2
+    numerator *= sigma_ft
+
+    # denominator = (mu_f^2 + mu_t^2 + C1) * (sigma_f^2 + sigma_t^2 + C2)
+    denominator = mu_f_sq
+    denominator += template.mu_sq
+    denominator += SSIM_C1
+    sigma_f_sq *= SSIM_COV_NORM
+    sigma_f_sq += template.sigma_sq
+    sigma_f_sq += SSIM_C2
+    denominator *= sigma_f_sq
+
+    numerator /= denominator
+    border = SSIM_BORDER
+    return float(numerator[border:-border, border:-border].mean(dtype=np.float64))
+
+
+def calculate_ssim(
+    frame: np.ndarray, template: Union[np.ndarray, TemplateStats]
+) -> float:
     """
     Calculate SSIM (Structural Similarity Index) between frame and template.
 
+    Computes the same score as scikit-image's structural_similarity with its
+    defaults: a 7x7 uniform window, sample covariance, and the mean taken
+    over the image minus a 3-pixel border.
+    A frame identical to the template (after grayscale conversion and
+    resizing) scores 1.0 without computing any local statistics.
+
     Args:
         frame: Video frame as numpy array
-        template: Template image as numpy array
+        template: Template image as numpy array, or its precomputed TemplateStats
 
     Returns:
         SSIM score (0.0 to 1.0, where 1.0 is perfect match)
     """
-    # Resize frame to match template dimensions
-    frame_resized = cv.resize(frame, (template.shape[1], template.shape[0]))
+    if not isinstance(template, TemplateStats):
+        template = compute_template_stats(template)
+
+    frame_gray = prepare_frame(frame, template)
+    if np.array_equal(frame_gray, template.gray):
+        return 1.0
+
+    return calculate_ssim_gray(frame_gray, template)
+
+
+def _decode_sequential(
+    capture: cv.VideoCapture, max_frames: int, frame_interval: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Grab every frame but only decode (retrieve) every Nth one."""
+    frame_count = 0
+    next_frame = frame_interval
+    while frame_count < max_frames:
+        if not capture.grab():
+            return
+
+        frame_count += 1
+
+        # Sample at interval (same pattern as Loups.scan())
+        if frame_count != next_frame:
+            continue
+        next_frame += frame_interval
+
+        ret, frame = capture.retrieve()
+        if not ret:
+            return
+
+        yield frame_count, frame
+
+
+def _decode_seeking(
+    capture: cv.VideoCapture, max_frames: int, frame_interval: int
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Seek directly to every Nth frame instead of grabbing the ones between."""
+    for frame_count in range(frame_interval, max_frames + 1, frame_interval):
+        # CAP_PROP_POS_FRAMES is 0-based; frame_count is 1-based
+        capture.set(cv.CAP_PROP_POS_FRAMES, frame_count - 1)
+        ret, frame = capture.read()
+        if not ret:
+            return
+
+        yield frame_count, frame
+
+
+def iter_sampled_frames(
+    capture: cv.VideoCapture,
+    max_frames: int,
+    frame_interval: int,
+    queue_size: int = FRAME_QUEUE_SIZE,
+    seek: bool = False,
+) -> Iterator[tuple[int, float, np.ndarray]]:
+    """
+    Decode every Nth frame in a background thread and yield it for scoring.
+
+    The producer thread decodes the sampled frames and pushes them into a
+    bounded queue, so decoding the next frames overlaps with whatever the
+    caller does with the current one. Closing the iterator early (e.g.
+    returning on the first match) stops the producer.
+
+    By default every frame is grabbed (demuxed) and only sampled frames are
+    retrieved. With ``seek=True`` the capture jumps straight to each sampled
+    frame instead. Seeking only pays off when the sampling interval is large
+    relative to the video's keyframe spacing: the decoder has to restart
+    from the preceding keyframe on every seek, which for long-GOP H.264 can
+    cost more than grabbing the skipped frames.
+
+    Args:
+        capture: Open video capture to read from
+        max_frames: Maximum number of frames to grab
+        frame_interval: Yield every Nth frame
+        queue_size: Maximum decoded frames buffered ahead of the consumer
+        seek: Seek to sampled frames with CAP_PROP_POS_FRAMES
 
-    # Convert to grayscale
-    frame_gray = cv.cvtColor(frame_resized, cv.COLOR_BGR2GRAY)
-    template_gray = cv.cvtColor(template, cv.COLOR_BGR2GRAY)
+    Yields:
+        Tuples of (frame_number, timestamp_ms, frame)
 
-    # Calculate SSIM
-    score = ssim(frame_gray, template_gray)
-    return score
+    Raises:
+        Exception: Any error raised while decoding is re-raised here
+    """
+    frame_queue = queue.Queue(maxsize=queue_size)
+    stop_event = threading.Event()
+    producer_error = None
+    decode = _decode_seeking if seek else _decode_sequential
+
+    def produce():
+        """Decode sampled frames into the queue."""
+        nonlocal producer_error
+        try:
+            for frame_count, frame in decode(capture, max_frames, frame_interval):
+                if stop_event.is_set():
+                    break
+
+                timestamp = capture.get(cv.CAP_PROP_POS_MSEC)
+                frame_queue.put((frame_count, timestamp, frame))
+        except Exception as e:
+            producer_error = e
+        finally:
+            # Sentinel: no more frames
+            frame_queue.put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    item = frame_queue.get()
+    try:
+        while item is not None:
+            yield item
+            item = frame_queue.get()
+    finally:
+        # Unblock and stop the producer if the consumer exits early
+        stop_event.set()
+        while item is not None:
+            item = frame_queue.get()
+        producer.join()
+
+    if producer_error is not None:
+        raise producer_error
 
 
 def extract_thumbnail(
     video_path: Path,
-    template_path: Optional[Path] = None,
+    template_path: Optional[Union[Path, np.ndarray]] = None,
     output_path: Optional[Path] = None,
     threshold: float = 0.35,
     scan_duration: int = 120,
     resolution: int = 3,
     on_progress: Optional[Callable[[int, int], None]] = None,
     quiet: bool = False,
+    prefilter_threshold: Optional[float] = None,
+    seek: bool = False,
+    ssim_width: Optional[int] = None,
+    hw_accel: bool = False,
 ) -> Optional[ThumbnailResult]:
     """
     Extract first frame matching template above threshold.
@@ -160,78 +619,123 @@ def extract_thumbnail(
 
     Args:
         video_path: Path to video file
-        template_path: Path to template image (uses default if None)
+        template_path: Path to template image or a loaded image (uses default
+            if None)
         output_path: Where to save thumbnail (generates default in cwd if None)
         threshold: Minimum SSIM score to accept (0.0-1.0)
         scan_duration: Maximum seconds to scan from video start
         resolution: Frames to process per second
-        on_progress: Optional callback for progress updates
+        on_progress: Optional callback for progress updates (rate-limited to
+            ~30 Hz and to changes in whole-percent progress)
         quiet: Suppress output
+        prefilter_threshold: Skip SSIM for flat frames and frames whose NCC
+            with the template is below this value, e.g.
+            NCC_PREFILTER_THRESHOLD. NCC does not bound SSIM, so this can
+            drop frames that would pass a low threshold (None, the default,
+            scores every sampled frame)
+        seek: Seek to each sampled frame instead of grabbing every frame
+            (see iter_sampled_frames for when this helps)
+        ssim_width: Score frames downscaled to at most this width first, and
+            confirm candidates within SSIM_CASCADE_MARGIN of the threshold at
+            full size (None scores every frame at full size)
+        hw_accel: Prefer a hardware video decoder (see open_video_capture)
 
     Returns:
         ThumbnailResult on success, None if no frame exceeds threshold
     """
-    extractor = ThumbnailExtractor(
+    with ThumbnailExtractor(
         video_path=video_path,
         template_path=template_path,
         resolution=resolution,
         scan_duration=scan_duration,
         threshold=threshold,
-    )
-
-    max_frames = int(scan_duration * extractor.frame_rate)
-    frame_interval = extractor.frame_frequency()
-
-    logger.debug(
-        f"Scanning {video_path.name}: max_frames={max_frames}, "
-        f"frame_interval={frame_interval}, threshold={threshold}"
-    )
-
-    frame_count = 0
-    frames_checked = 0
-
-    while frame_count < max_frames:
-        ret = extractor.capture.grab()
-        if not ret:
-            break
-
-        frame_count += 1
-
-        # Sample at interval (same pattern as Loups.scan())
-        if frame_count % frame_interval != 0:
-            continue
-
-        ret, frame = extractor.capture.retrieve()
-        if not ret:
-            break
-
-        frames_checked += 1
-        score = calculate_ssim(frame, extractor.template)
-
-        logger.debug(f"Frame {frame_count}: SSIM score = {score:.4f}")
-
-        # Call progress callback if provided
-        if on_progress and not quiet:
-            on_progress(frame_count, max_frames)
-
-        # First frame above threshold wins!
-        if score >= threshold:
-            output = output_path or generate_default_output_path(video_path)
-            cv.imwrite(str(output), frame)
-            timestamp = extractor.capture.get(cv.CAP_PROP_POS_MSEC)
-
-            logger.info(
-                f"Thumbnail extracted: frame={frame_count}, "
-                f"timestamp={timestamp:.0f}ms, score={score:.4f}, path={output}"
-            )
-
-            return ThumbnailResult(
-                success=True,
-                frame_number=frame_count,
-                timestamp_ms=timestamp,
-                ssim_score=score,
-                output_path=output,
-            )
+        ssim_width=ssim_width,
+        hw_accel=hw_accel,
+    ) as extractor:
+        max_frames = int(scan_duration * extractor.frame_rate)
+        frame_interval = extractor.frame_frequency()
+
+        logger.debug(
+            f"Scanning {video_path.name}: max_frames={max_frames}, "
+            f"frame_interval={frame_interval}, threshold={threshold}"
+        )
+
+        template = extractor.scan_stats
+
+        # Downscaled scores only gate the full-size check, so they get a margin
+        downscaled = template is not extractor.template_stats
+        gate = threshold - SSIM_CASCADE_MARGIN if downscaled else threshold
+
+        # A flat template can still match flat frames and makes NCC undefined,
+        # so only prefilter when the template has structure
+        use_prefilter = prefilter_threshold is not None and np.ptp(template.gray) > 0
+
+        frames_checked = 0
+        progress = throttle_progress(on_progress) if on_progress and not quiet else None
+
+        def candidate_frames(sampled_frames):
+            """Prepare sampled frames and drop the ones that fail the prefilter."""
+            nonlocal frames_checked
+            # Full-size grayscale intermediate, shared by every frame
+            gray_buffer = None
+            for frame_count, timestamp, frame in sampled_frames:
+                frames_checked += 1
+                if gray_buffer is None:
+                    gray_buffer = np.empty(frame.shape[:2], dtype=np.uint8)
+                frame_gray = prepare_frame(frame, template, gray_buffer)
+
+                # Call (rate-limited) progress callback if provided
+                if progress:
+                    progress(frame_count, max_frames)
+
+                # Cheap early rejects before the full SSIM computation
+                if use_prefilter:
+                    if is_flat_frame(frame_gray):
+                        logger.debug("Frame %d: flat frame, skipped", frame_count)
+                        continue
+
+                    ncc = calculate_ncc(frame_gray, template)
+                    if ncc < prefilter_threshold:
+                        logger.debug("Frame %d: NCC = %.4f, skipped", frame_count, ncc)
+                        continue
+
+                yield frame_count, timestamp, frame, frame_gray
+
+        # SSIM work arrays, reused by every frame of this scan
+        ssim_scratch = {}
+
+        # Decoding runs in a background thread so it overlaps with SSIM scoring
+        sampled_frames = iter_sampled_frames(
+            extractor.capture, max_frames, frame_interval, seek=seek
+        )
+        with closing(sampled_frames):
+            candidates = candidate_frames(sampled_frames)
+            for frame_count, timestamp, frame, frame_gray in candidates:
+                score = calculate_ssim_gray(frame_gray, template, ssim_scratch)
+                logger.debug("Frame %d: SSIM score = %.4f", frame_count, score)
+
+                if score >= gate and downscaled:
+                    score = calculate_ssim(frame, extractor.template_stats)
+                    logger.debug("Frame %d: full-size SSIM = %.4f", frame_count, score)
+
+                # First frame above threshold wins!
+                if score >= threshold:
+                    output = output_path or generate_default_output_path(video_path)
+                    cv.imwrite(str(output), frame)
+
+                    logger.info(
+                        f"Thumbnail extracted: frame={frame_count}, "
+                        f"timestamp={timestamp:.0f}ms, score={score:.4f}, "
+                        f"path={output}"
+                    )
+
+                    return ThumbnailResult(
+                        success=True,
+                        frame_number=frame_count,
+                        timestamp_ms=timestamp,
+                        ssim_score=score,
+                        output_path=output,
+                    )
 
     # No match found - log warning and return None
     logger.warning(
@@ -99,14 +99,15 @@ def mock_imread():
 # ============================================================================
 
 
-@pytest.fixture
-def mock_template_image(tmp_path):
+@pytest.fixture(scope="session")
+def mock_template_image(tmp_path_factory):
     """Create a standard 100x100x3 test template image file.
 
-    Creates a black template image and saves it to a temporary file.
+    Creates a black template image and saves it to a temporary file once per
+    session; tests only read it.
 
     Args:
-        tmp_path: pytest's temporary directory fixture
+        tmp_path_factory: pytest's session temporary directory factory
 
     Returns:
         Path: Path to the created template image file
@@ -116,7 +117,7 @@ def mock_template_image(tmp_path):
             template_path = mock_template_image
             # Use the template file
     """
-    template_path = tmp_path / "template.png"
+    template_path = tmp_path_factory.mktemp("template") / "template.png"
     template_img = np.zeros((100, 100, 3), dtype=np.uint8)
     cv.imwrite(str(template_path), template_img)
     return template_path
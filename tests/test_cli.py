@@ -18,20 +18,83 @@ What we CAN test:
 - File operations
 - Error handling
 - Flag combinations
+
+Every test is independent (temporary paths, mocked externals), so the module
+can be distributed across workers with ``pytest -n auto tests/test_cli.py``.
 """
 
+import contextlib
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+import loups.cli
 from loups.cli import app
+from loups.thumbnail_extractor import ThumbnailResult
+
+CHAPTERS_TEXT = "\n".join(
+    (
+        "0:00:00 Game Start",
+        "0:05:23 Sarah Johnson #7",
+        "0:08:45 Emma Martinez #12",
+    )
+)
+
+# The output path is never written because extraction is mocked; use
+# SUCCESS_RESULT._replace(...) when a test needs different values.
+SUCCESS_RESULT = ThumbnailResult(
+    success=True,
+    output_path=Path("thumbnail.jpg"),
+    frame_number=10,
+    timestamp_ms=333.33,
+    ssim_score=0.95,
+)
+
+
+@contextlib.contextmanager
+def fake_isatty(value):
+    """Temporarily make ``sys.stdout.isatty()`` return ``value`` in the CLI module.
+
+    A plain attribute swap avoids building a MagicMock for every invocation.
+    """
+    stdout = loups.cli.sys.stdout
+    saved = stdout.isatty
+    stdout.isatty = lambda: value
+    try:
+        yield
+    finally:
+        stdout.isatty = saved
 
 
-@pytest.fixture
+def invoke(runner, args, **kwargs):
+    """Invoke the CLI, letting unexpected exceptions propagate to pytest.
+
+    Skips CliRunner's traceback capture for tests that only check output and
+    exit codes; pass ``catch_exceptions=True`` to inspect ``result.exception``.
+    """
+    kwargs.setdefault("catch_exceptions", False)
+    return runner.invoke(app, args, **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def _tty(request):
+    """Fake the stdout TTY state for tests marked ``piped`` or ``tty``."""
+    if request.node.get_closest_marker("piped"):
+        with fake_isatty(False):
+            yield
+    elif request.node.get_closest_marker("tty"):
+        with fake_isatty(True):
+            yield
+    else:
+        yield
+
+
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CliRunner for testing.
+    """Create a CliRunner shared by every test in the session.
 
     Note: mix_stderr parameter support varies by Typer version.
     Older versions don't support it, so we use a try-except approach.
@@ -44,50 +107,78 @@ def runner():
         return CliRunner()
 
 
-@pytest.fixture
-def test_video(tmp_path):
-    """Create a temporary video file for testing."""
-    video_file = tmp_path / "test_video.mp4"
+@pytest.fixture(scope="session", autouse=True)
+def _warm_app(runner):
+    """Invoke ``--help`` once so Typer builds the click command up front."""
+    runner.invoke(app, ["--help"])
+
+
+@pytest.fixture(scope="session")
+def test_video(tmp_path_factory):
+    """Create a temporary video file shared by every test in the session."""
+    video_file = tmp_path_factory.mktemp("video") / "test_video.mp4"
     video_file.write_text("fake video content")
     return video_file
 
 
-@pytest.fixture
-def mock_loups():
-    """Mock the Loups class and its scan method."""
-    with patch("loups.cli.Loups") as mock:
-        # Create a mock game instance
-        game_instance = MagicMock()
-        game_instance.batter_count = 5
-        game_instance.batters.display.return_value = (
-            "0:00:00 Game Start\n"
-            "0:05:23 Sarah Johnson #7\n"
-            "0:08:45 Emma Martinez #12"
-        )
-        mock.return_value = game_instance
-        yield mock
+@pytest.fixture(scope="module")
+def loups_patcher():
+    """Build the Loups patcher once; tests start and stop it individually."""
+    return patch.object(loups.cli, "Loups")
+
+
+class _Batters:
+    """Minimal stand-in for ``Loups.batters``."""
+
+    def display(self):
+        """Return the chapter listing produced by a successful scan."""
+        return CHAPTERS_TEXT
 
 
 @pytest.fixture
-def mock_template(tmp_path):
-    """Create a temporary template file for testing."""
-    template_file = tmp_path / "template.png"
+def mock_loups(loups_patcher):
+    """Mock the Loups class with a lightweight game stub.
+
+    Tests that need ``scan`` to fail can replace ``mock.return_value.scan``.
+    """
+    mock = loups_patcher.start()
+    mock.return_value = SimpleNamespace(
+        batter_count=5, batters=_Batters(), scan=lambda *args, **kwargs: None
+    )
+    yield mock
+    loups_patcher.stop()
+
+
+@pytest.fixture(scope="session")
+def template_file(tmp_path_factory):
+    """Create a temporary template file shared by every test in the session."""
+    template_file = tmp_path_factory.mktemp("template") / "template.png"
     template_file.write_text("fake template content")
+    return template_file
 
-    with patch("loups.cli.get_default_template") as mock:
-        mock.return_value = template_file
-        yield mock
+
+@pytest.fixture(scope="module")
+def template_patcher(template_file):
+    """Build the default-template patcher once per module."""
+    return patch.object(loups.cli, "get_default_template", return_value=template_file)
+
+
+@pytest.fixture
+def mock_template(template_patcher):
+    """Patch the default template lookup to return the temporary template."""
+    yield template_patcher.start()
+    template_patcher.stop()
 
 
 class TestPipeDetection:
     """Test automatic pipe detection and behavior changes."""
 
+    @pytest.mark.piped
     def test_piped_output_hides_progress(
         self, runner, test_video, mock_loups, mock_template
     ):
         """Test that progress is hidden when output is piped."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = invoke(runner, [str(test_video)])
 
         # Should NOT show progress messages when piped
         assert "Scanning video:" not in result.stdout
@@ -98,22 +189,25 @@ class TestPipeDetection:
         assert "0:00:00 Game Start" in result.stdout
         assert "Sarah Johnson #7" in result.stdout
 
+    @pytest.mark.parametrize("quiet_first", [True, False])
     def test_quiet_mode_suppresses_all_output(
-        self, runner, test_video, mock_loups, mock_template
+        self, runner, test_video, mock_loups, mock_template, quiet_first
     ):
-        """Test that quiet mode suppresses all stdout regardless of TTY."""
+        """Test that quiet mode suppresses all stdout regardless of flag position."""
+        args = ["-q", str(test_video)] if quiet_first else [str(test_video), "-q"]
+
         # Quiet mode should suppress output
-        result = runner.invoke(app, ["-q", str(test_video)])
+        result = invoke(runner, args)
         assert result.stdout == ""
 
+    @pytest.mark.piped
     def test_piped_with_output_file_saves_silently(
         self, runner, test_video, mock_loups, mock_template, tmp_path
     ):
         """Test that piped mode with --output saves file without confirmation."""
         output_file = tmp_path / "chapters.txt"
 
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, ["-o", str(output_file), str(test_video)])
+        result = invoke(runner, ["-o", str(output_file), str(test_video)])
 
         # Should NOT show save confirmation when piped
         assert "Results saved to:" not in result.stdout
@@ -130,7 +224,7 @@ class TestPipeDetection:
         """Test that --output file is created with correct chapter content."""
         output_file = tmp_path / "chapters.txt"
 
-        result = runner.invoke(app, ["-o", str(output_file), str(test_video)])
+        result = invoke(runner, ["-o", str(output_file), str(test_video)])
 
         # Should complete successfully
         assert result.exit_code == 0
@@ -152,10 +246,10 @@ class TestOutputFormatting:
     Interactive Rich formatting must be manually tested.
     """
 
+    @pytest.mark.piped
     def test_piped_uses_plain_text(self, runner, test_video, mock_loups, mock_template):
         """Test that piped mode outputs plain text without formatting."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = invoke(runner, [str(test_video)])
 
         # Should not contain rich formatting
         assert "[bold]" not in result.stdout
@@ -172,41 +266,41 @@ class TestProgressDisplay:
     We test the logic (quiet flag, piped detection) but not the visual output.
     """
 
+    @pytest.mark.piped
     def test_progress_disabled_when_piped(
         self, runner, test_video, mock_loups, mock_template
     ):
         """Test that show_progress is False when output is piped."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            with patch("loups.cli.Live") as mock_live:
-                runner.invoke(app, [str(test_video)])
+        with patch.object(loups.cli, "Live") as mock_live:
+            invoke(runner, [str(test_video)])
 
-                # Live progress should NOT be used when piped
-                mock_live.assert_not_called()
+            # Live progress should NOT be used when piped
+            mock_live.assert_not_called()
 
+    @pytest.mark.tty
     def test_progress_disabled_with_quiet_flag(
         self, runner, test_video, mock_loups, mock_template
     ):
         """Test that show_progress is False with --quiet even in TTY."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=True):
-            with patch("loups.cli.Live") as mock_live:
-                runner.invoke(app, [str(test_video), "-q"])
+        with patch.object(loups.cli, "Live") as mock_live:
+            invoke(runner, [str(test_video), "-q"])
 
-                # Live progress should NOT be used with --quiet
-                mock_live.assert_not_called()
+            # Live progress should NOT be used with --quiet
+            mock_live.assert_not_called()
 
 
 class TestErrorHandling:
     """Test error handling in different output modes."""
 
+    @pytest.mark.piped
     def test_errors_go_to_stderr_in_piped_mode(
         self, runner, test_video, mock_loups, mock_template
     ):
         """Test that errors go to stderr even when output is piped."""
         # Make scan fail
-        mock_loups.return_value.scan.side_effect = Exception("Scan failed!")
+        mock_loups.return_value.scan = Mock(side_effect=Exception("Scan failed!"))
 
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = runner.invoke(app, [str(test_video)])
 
         # Error should be in stderr (if separately captured) or output
         try:
@@ -218,15 +312,15 @@ class TestErrorHandling:
         assert "Error:" in error_output or "Scan failed" in error_output
         assert result.exit_code != 0
 
+    @pytest.mark.tty
     def test_errors_go_to_stderr_in_interactive_mode(
         self, runner, test_video, mock_loups, mock_template
     ):
         """Test that errors go to stderr in interactive mode."""
         # Make scan fail
-        mock_loups.return_value.scan.side_effect = Exception("Scan failed!")
+        mock_loups.return_value.scan = Mock(side_effect=Exception("Scan failed!"))
 
-        with patch("loups.cli.sys.stdout.isatty", return_value=True):
-            result = runner.invoke(app, [str(test_video)])
+        result = runner.invoke(app, [str(test_video)])
 
         # Error should be in stderr (if separately captured) or output
         try:
@@ -248,7 +342,7 @@ class TestCombinedFlags:
         """Test --quiet with --output file."""
         output_file = tmp_path / "chapters.txt"
 
-        result = runner.invoke(app, ["-q", "-o", str(output_file), str(test_video)])
+        result = invoke(runner, ["-q", "-o", str(output_file), str(test_video)])
 
         # Quiet mode should suppress stdout
         assert result.stdout == ""
@@ -256,14 +350,14 @@ class TestCombinedFlags:
         # File should still be created
         assert output_file.exists()
 
+    @pytest.mark.piped
     def test_log_and_piped_output(
         self, runner, test_video, mock_loups, mock_template, tmp_path
     ):
         """Test --log works correctly when output is piped."""
         log_file = tmp_path / "test.log"
 
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, ["--log", str(log_file), str(test_video)])
+        result = invoke(runner, ["--log", str(log_file), str(test_video)])
 
         # Should output chapters to stdout
         assert "0:00:00 Game Start" in result.stdout
@@ -271,16 +365,14 @@ class TestCombinedFlags:
         # Log file should be created
         assert log_file.exists()
 
+    @pytest.mark.piped
     def test_debug_mode_with_pipe(
         self, runner, test_video, mock_loups, mock_template, tmp_path
     ):
         """Test --debug mode works when piped."""
         log_file = tmp_path / "debug.log"
 
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(
-                app, ["--log", str(log_file), "--debug", str(test_video)]
-            )
+        result = invoke(runner, ["--log", str(log_file), "--debug", str(test_video)])
 
         # Should still output to stdout when piped
         assert "0:00:00 Game Start" in result.stdout
@@ -292,29 +384,29 @@ class TestCombinedFlags:
 class TestRealWorldScenarios:
     """Test real-world usage scenarios."""
 
+    @pytest.mark.piped
     def test_redirect_to_file(self, runner, test_video, mock_loups, mock_template):
         """Simulate: loups video.mp4 > output.txt."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = invoke(runner, [str(test_video)])
 
         # Should be clean output suitable for redirection
         assert "Scanning video:" not in result.stdout
         assert result.stdout.strip().startswith("0:00:00")
 
+    @pytest.mark.piped
     def test_pipe_to_grep(self, runner, test_video, mock_loups, mock_template):
         r"""Simulate: loups video.mp4 | grep "Sarah"."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = invoke(runner, [str(test_video)])
 
         # Should contain searchable plain text
         assert "Sarah Johnson #7" in result.stdout
         # Should not have progress animations
         assert "🥎" not in result.stdout
 
+    @pytest.mark.piped
     def test_command_substitution(self, runner, test_video, mock_loups, mock_template):
         """Simulate: chapters=$(loups video.mp4)."""
-        with patch("loups.cli.sys.stdout.isatty", return_value=False):
-            result = runner.invoke(app, [str(test_video)])
+        result = invoke(runner, [str(test_video)])
 
         # Output should be clean for variable capture
         lines = result.stdout.strip().split("\n")
@@ -326,26 +418,16 @@ class TestThumbnailSubcommandLogging:
     """Test thumbnail subcommand logging functionality."""
 
     @pytest.fixture
-    def mock_thumbnail_extractor(self, tmp_path):
+    def mock_thumbnail_extractor(self):
         """Mock the extract_thumbnail function to return a successful result."""
-        from loups.thumbnail_extractor import ThumbnailResult
-
-        with patch("loups.cli.extract_thumbnail") as mock_extract:
-            # Create a mock successful result
-            result = ThumbnailResult(
-                success=True,
-                output_path=tmp_path / "thumbnail.jpg",
-                frame_number=10,
-                timestamp_ms=333.33,
-                ssim_score=0.95,
-            )
-            mock_extract.return_value = result
+        with patch.object(loups.cli, "extract_thumbnail") as mock_extract:
+            mock_extract.return_value = SUCCESS_RESULT
             yield mock_extract
 
     @pytest.fixture
     def mock_setup_logging(self):
         """Mock setup_logging to track that it was called with correct parameters."""
-        with patch("loups.cli.setup_logging") as mock_setup:
+        with patch.object(loups.cli, "setup_logging") as mock_setup:
             yield mock_setup
 
     def test_thumbnail_log_flag_creates_log_file(
@@ -354,8 +436,8 @@ class TestThumbnailSubcommandLogging:
         """Test that --log flag creates a log file for thumbnail subcommand."""
         log_file = tmp_path / "thumbnail.log"
 
-        result = runner.invoke(
-            app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
+        result = invoke(
+            runner, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
         )
 
         # Command should succeed
@@ -364,60 +446,29 @@ class TestThumbnailSubcommandLogging:
         # Log file should be created
         assert log_file.exists()
 
-    def test_thumbnail_log_configures_logging_with_path(
-        self, runner, test_video, mock_thumbnail_extractor, mock_setup_logging, tmp_path
+    @pytest.mark.parametrize("extra_args,debug", [([], False), (["--debug"], True)])
+    def test_thumbnail_log_passes_args_to_setup_logging(
+        self,
+        runner,
+        test_video,
+        mock_thumbnail_extractor,
+        mock_setup_logging,
+        tmp_path,
+        extra_args,
+        debug,
     ):
-        """Test that --log flag configures logging with the correct path."""
-        log_file = tmp_path / "thumbnail_info.log"
-
-        result = runner.invoke(
-            app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
-        )
-
-        assert result.exit_code == 0
-        # Verify setup_logging was called with the log path
-        mock_setup_logging.assert_called_once()
-        call_args = mock_setup_logging.call_args
-        assert call_args[0][0] == Path(log_file)  # log_path parameter
-        assert call_args[0][1] is True  # quiet parameter
-        assert call_args[0][2] is False  # debug parameter
-
-    def test_thumbnail_debug_enables_debug_in_setup_logging(
-        self, runner, test_video, mock_thumbnail_extractor, mock_setup_logging, tmp_path
-    ):
-        """Test that --debug flag enables debug in setup_logging."""
-        log_file = tmp_path / "thumbnail_debug.log"
-
-        result = runner.invoke(
-            app,
-            [str(test_video), "thumbnail", "--log", str(log_file), "--debug", "-q"],
-        )
-
-        assert result.exit_code == 0
-        # Verify setup_logging was called with debug=True
-        mock_setup_logging.assert_called_once()
-        call_args = mock_setup_logging.call_args
-        assert call_args[0][0] == Path(log_file)  # log_path parameter
-        assert call_args[0][1] is True  # quiet parameter
-        assert call_args[0][2] is True  # debug parameter (should be True!)
-
-    def test_thumbnail_log_and_debug_both_passed_to_setup(
-        self, runner, test_video, mock_thumbnail_extractor, mock_setup_logging, tmp_path
-    ):
-        """Test that --log and --debug are both passed to setup_logging."""
-        log_file = tmp_path / "combined.log"
+        """Test that --log, -q and --debug are passed through to setup_logging."""
+        log_file = tmp_path / "thumbnail.log"
 
-        result = runner.invoke(
-            app,
-            [str(test_video), "thumbnail", "--log", str(log_file), "--debug", "-q"],
+        result = invoke(
+            runner,
+            [str(test_video), "thumbnail", "--log", str(log_file), "-q", *extra_args],
         )
 
         assert result.exit_code == 0
-        # Verify both parameters are passed correctly
         mock_setup_logging.assert_called_once()
-        call_args = mock_setup_logging.call_args
-        assert call_args[0][0] == Path(log_file)
-        assert call_args[0][2] is True  # debug=True
+        # (log_path, quiet, debug)
+        assert mock_setup_logging.call_args[0] == (Path(log_file), True, debug)
 
     def test_thumbnail_log_without_debug_is_info_level(
         self, runner, test_video, mock_thumbnail_extractor, tmp_path
@@ -425,41 +476,12 @@ class TestThumbnailSubcommandLogging:
         """Test that without --debug, logging defaults to INFO level."""
         log_file = tmp_path / "info_only.log"
 
-        # Mock extract_thumbnail to trigger some logging
-        with patch("loups.cli.extract_thumbnail") as mock_extract:
-            from loups.thumbnail_extractor import ThumbnailResult
-
-            result_obj = ThumbnailResult(
-                success=True,
-                output_path=tmp_path / "thumb.jpg",
-                frame_number=5,
-                timestamp_ms=166.67,
-                ssim_score=0.92,
-            )
-            mock_extract.return_value = result_obj
-
-            result = runner.invoke(
-                app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
-            )
-
-        assert result.exit_code == 0
-        assert log_file.exists()
-
-    def test_thumbnail_logging_called_when_log_flag_used(
-        self, runner, test_video, mock_thumbnail_extractor, mock_setup_logging, tmp_path
-    ):
-        """Test that setup_logging is called when --log flag is used."""
-        log_file = tmp_path / "test.log"
-        result = runner.invoke(
-            app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
+        result = invoke(
+            runner, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
         )
 
         assert result.exit_code == 0
-        # Verify setup_logging was called
-        mock_setup_logging.assert_called_once()
-        # Verify it was called with a log path (not None)
-        call_args = mock_setup_logging.call_args
-        assert call_args[0][0] is not None  # log_path should not be None
+        assert log_file.exists()
 
     def test_thumbnail_log_with_custom_path(
         self, runner, test_video, mock_thumbnail_extractor, tmp_path
@@ -468,26 +490,25 @@ class TestThumbnailSubcommandLogging:
         custom_log = tmp_path / "custom" / "my_thumbnail.log"
         custom_log.parent.mkdir(parents=True)
 
-        result = runner.invoke(
-            app, [str(test_video), "thumbnail", "--log", str(custom_log), "-q"]
+        result = invoke(
+            runner, [str(test_video), "thumbnail", "--log", str(custom_log), "-q"]
         )
 
         assert result.exit_code == 0
         assert custom_log.exists()
 
     def test_thumbnail_logging_with_extraction_failure(
-        self, runner, test_video, tmp_path
+        self, runner, test_video, mock_thumbnail_extractor, tmp_path
     ):
         """Test that logging works even when thumbnail extraction fails."""
         log_file = tmp_path / "error.log"
 
-        # Mock extract_thumbnail to return None (no match found)
-        with patch("loups.cli.extract_thumbnail") as mock_extract:
-            mock_extract.return_value = None
+        # No match found
+        mock_thumbnail_extractor.return_value = None
 
-            result = runner.invoke(
-                app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
-            )
+        result = invoke(
+            runner, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
+        )
 
         # Should exit with error code (fatal for standalone command)
         assert result.exit_code != 0
@@ -495,17 +516,17 @@ class TestThumbnailSubcommandLogging:
         # Log file should still be created
         assert log_file.exists()
 
-    def test_thumbnail_logging_with_exception(self, runner, test_video, tmp_path):
+    def test_thumbnail_logging_with_exception(
+        self, runner, test_video, mock_thumbnail_extractor, tmp_path
+    ):
         """Test that logging captures exceptions during thumbnail extraction."""
         log_file = tmp_path / "exception.log"
 
-        # Mock extract_thumbnail to raise an exception
-        with patch("loups.cli.extract_thumbnail") as mock_extract:
-            mock_extract.side_effect = Exception("Test extraction failure")
+        mock_thumbnail_extractor.side_effect = Exception("Test extraction failure")
 
-            result = runner.invoke(
-                app, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
-            )
+        result = invoke(
+            runner, [str(test_video), "thumbnail", "--log", str(log_file), "-q"]
+        )
 
         # Should exit with error
         assert result.exit_code != 0
@@ -519,8 +540,8 @@ class TestThumbnailSubcommandLogging:
         """Test that --quiet suppresses stdout but setup_logging is still called."""
         log_file = tmp_path / "quiet_test.log"
 
-        result = runner.invoke(
-            app,
+        result = invoke(
+            runner,
             [str(test_video), "thumbnail", "--log", str(log_file), "--debug", "-q"],
         )
 
@@ -3,7 +3,7 @@
 from pathlib import Path
 from unittest.mock import Mock, patch
 
-from loups.frame_utils import calculate_frame_frequency
+from loups.frame_utils import calculate_frame_frequency, throttle_progress
 from loups.loups import Loups
 from loups.thumbnail_extractor import ThumbnailExtractor
 
@@ -40,10 +40,8 @@ class TestCalculateFrameFrequency:
         """Test when resolution is higher than frame rate."""
         # Should still return at least 1 (every frame)
         result = calculate_frame_frequency(10.0, 15)
-        # 10 / 15 = 0.666... -> int() = 0, but function should handle this
-        # Based on implementation: int(10.0 / 15) = 0
-        # This might need handling in the actual implementation
-        assert result == 0  # Current implementation returns 0
+        # 10 / 15 = 0.666... -> int() = 0, clamped so no frame is skipped
+        assert result == 1
 
     def test_float_frame_rate(self):
         """Test with non-integer frame rate."""
@@ -79,6 +77,44 @@ class TestCalculateFrameFrequency:
             )
 
 
+class TestThrottleProgress:
+    """Test throttle_progress wrapper."""
+
+    def test_drops_updates_within_interval(self):
+        """Test that calls closer together than min_interval are dropped."""
+        callback = Mock()
+        progress = throttle_progress(callback, min_interval=1.0)
+
+        with patch("loups.frame_utils.time.monotonic", side_effect=[0.0, 0.5, 1.5]):
+            progress(10, 100)
+            progress(20, 100)  # only 0.5s later
+            progress(30, 100)
+
+        assert [c.args for c in callback.call_args_list] == [(10, 100), (30, 100)]
+
+    def test_drops_unchanged_percentage(self):
+        """Test that updates without a whole-percent change are coalesced."""
+        callback = Mock()
+        progress = throttle_progress(callback, min_interval=0.0)
+
+        progress(1, 1000)
+        progress(5, 1000)  # still 0%
+        progress(10, 1000)
+
+        assert [c.args for c in callback.call_args_list] == [(1, 1000), (10, 1000)]
+
+    def test_always_forwards_final_update(self):
+        """Test that 100% is reported even right after the previous update."""
+        callback = Mock()
+        progress = throttle_progress(callback, min_interval=1.0)
+
+        with patch("loups.frame_utils.time.monotonic", side_effect=[0.0, 0.01]):
+            progress(99, 100)
+            progress(100, 100)  # within min_interval of the 99% update
+
+        assert [c.args for c in callback.call_args_list] == [(99, 100), (100, 100)]
+
+
 class TestFrameUtilsIntegration:
     """Test frame_utils integration with Loups and ThumbnailExtractor."""
 
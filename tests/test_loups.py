@@ -1,7 +1,8 @@
 """Loups pytest suite."""
 
 import logging
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -57,6 +58,32 @@ class TestBatterInfo:
         logger.debug(f"{display=}")
         assert display[0] == "00:00 Game Time"
 
+    def test_display_formats_every_chapter(self):
+        """Test full chapter output, including hour-long timestamps."""
+        batters = loups.BatterInfo(
+            [
+                loups.FrameBatterInfo(
+                    loups.MilliSecond(5_000), 0.9, True, True, "A #1"
+                ),
+                loups.FrameBatterInfo(
+                    loups.MilliSecond(3_725_400.5), 0.9, True, True, "B #2"
+                ),
+            ]
+        )
+        assert batters.display() == "00:00 A #1\n01:02:05 B #2"
+
+
+@pytest.fixture(scope="module")
+def ocr_template():
+    """Template as a 2D (height, width) array; Size expects exactly 2 values."""
+    return np.zeros((100, 500), dtype=np.uint8)
+
+
+@pytest.fixture(scope="module")
+def ocr_frame():
+    """Frame large enough for any slice batter_name takes."""
+    return np.zeros((1000, 1000), dtype=np.uint8)
+
 
 class TestBatterName:
     """Test the batter_name method to ensure '#' characters appear at end."""
@@ -232,7 +259,9 @@ class TestBatterName:
             ),
         ],
     )
-    def test_batter_name_ensures_hash_at_end(self, ocr_results, expected_output):
+    def test_batter_name_ensures_hash_at_end(
+        self, ocr_template, ocr_frame, ocr_results, expected_output
+    ):
         """Test that batter_name always places '#' characters at the end.
 
         This test mocks the EasyOCR reader to return controlled test data,
@@ -246,21 +275,12 @@ class TestBatterName:
         order regardless of OCR's internal detection order (e.g., prevents
         "Garcia Lily" when the screen shows "Lily Garcia").
         """
-        # Create a mock Loups instance with required attributes
-        loups_instance = MagicMock(spec=["template", "frame", "get_reader"])
-
-        # Mock the get_reader method to return a mock reader
-        mock_reader = MagicMock()
-        mock_reader.readtext.return_value = ocr_results
-        loups_instance.get_reader.return_value = mock_reader
-
-        # Mock the template as a 2D numpy array with shape (height, width)
-        # Size namedtuple expects exactly 2 values: (height, width)
-        loups_instance.template = np.zeros((100, 500), dtype=np.uint8)
-
-        # Mock the frame as a numpy array that supports slicing
-        # Make it large enough for any slice operation
-        loups_instance.frame = np.zeros((1000, 1000), dtype=np.uint8)
+        # Stand-in Loups instance: batter_name only reads template, frame and
+        # get_reader(), and the reader returns the controlled OCR results
+        reader = SimpleNamespace(readtext=lambda image: ocr_results)
+        loups_instance = SimpleNamespace(
+            template=ocr_template, frame=ocr_frame, get_reader=lambda: reader
+        )
 
         # Call the actual batter_name method with our mocked instance
         result = loups.Loups.batter_name(
@@ -269,3 +289,43 @@ class TestBatterName:
 
         # Verify the result matches expected output
         assert result == expected_output
+
+
+class TestGetReader:
+    """Test the shared EasyOCR reader."""
+
+    def test_reader_is_created_once(self):
+        """Test that the reader is built on first use and then reused."""
+        with (
+            patch.object(loups.Loups, "_reader", None),
+            patch.object(loups.easyocr, "Reader") as mock_reader_cls,
+        ):
+            first = loups.Loups.get_reader()
+            second = loups.Loups.get_reader()
+
+        assert first is second
+        mock_reader_cls.assert_called_once_with(["en"])
+
+
+class TestAdaptiveSkip:
+    """Test adaptive frame skipping in Loups.scan."""
+
+    @pytest.mark.parametrize("adaptive_skip, expected_matches", [(False, 4), (True, 1)])
+    def test_static_frames_reuse_match_result(
+        self, mock_video_capture_30fps, mock_imread, adaptive_skip, expected_matches
+    ):
+        """Test that unchanged frames skip template matching when enabled."""
+        # 40 identical frames at 30 fps, sampled every 10th frame
+        mock_video_capture_30fps.grab.side_effect = [True] * 40 + [False]
+        mock_video_capture_30fps.retrieve.return_value = (
+            True,
+            np.zeros((60, 80, 3), dtype=np.uint8),
+        )
+
+        game = loups.Loups("dummy.mp4", "dummy.png", adaptive_skip=adaptive_skip)
+        with patch.object(loups.Loups, "match_template_scan") as mock_match:
+            mock_match.return_value.result = (False, 0.1, loups.Point(0, 0))
+            game.scan()
+
+        assert mock_match.call_count == expected_matches
+        assert game.batter_count == 0
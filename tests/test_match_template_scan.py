@@ -9,7 +9,7 @@ This module tests all aspects of the MatchTemplateScan functionality including:
 - Real template matching with actual data
 """
 
-from pathlib import Path
+from importlib.resources import as_file, files
 
 import cv2 as cv
 import numpy as np
@@ -23,74 +23,164 @@ from loups.match_template_scan import MatchTemplateResult, MatchTemplateScan
 # ============================================================================
 
 
-@pytest.fixture
+def read_only(array):
+    """Mark ``array`` read-only so session-scoped fixtures cannot be mutated."""
+    array.flags.writeable = False
+    return array
+
+
+# 200x200 image with a 50x50 white block at (20, 20); the quadrant fixtures
+# below shift this one base image instead of drawing their own.
+_BASE_IMAGE = np.zeros((200, 200), dtype=np.uint8)
+_BASE_IMAGE[20:70, 20:70] = 255
+read_only(_BASE_IMAGE)
+
+
+def shift_image(base, dy, dx):
+    """Return a writable copy of ``base`` shifted down by dy and right by dx."""
+    return np.roll(base, (dy, dx), axis=(0, 1))
+
+
+@pytest.fixture(scope="session")
 def simple_template():
-    """Create a simple 50x50 grayscale template with a white square."""
+    """Create a simple 50x50 grayscale template with a white square.
+
+    Shared by the whole session, so it is read-only.
+    """
     template = np.zeros((50, 50), dtype=np.uint8)
     template[10:40, 10:40] = 255  # White square in center
-    return template
+    return read_only(template)
+
+
+# The image fixtures below are shared by the whole session, so they are
+# read-only; tests that need to draw on one take a copy.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_image_with_match_bottom_left():
     """Create a 200x200 image with the template in bottom-left quadrant."""
-    image = np.zeros((200, 200), dtype=np.uint8)
-    # Place match at (20, 120) - bottom-left quadrant
-    # Bottom-left of match: (20, 170) which is x < 100 and y > 100
-    image[120:170, 20:70] = 255  # White square
-    image[130:160, 30:60] = 255  # Ensure it matches the template pattern
-    return image
+    # Match at (20, 120); its bottom-left (20, 170) has x < 100 and y > 100
+    return read_only(shift_image(_BASE_IMAGE, 100, 0))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_image_with_match_top_left():
     """Create a 200x200 image with the template in top-left quadrant."""
-    image = np.zeros((200, 200), dtype=np.uint8)
-    # Place match at (20, 20) - top-left quadrant
-    image[20:70, 20:70] = 255
-    image[30:60, 30:60] = 255
-    return image
+    # Match at (20, 20)
+    return read_only(_BASE_IMAGE.copy())
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_image_with_match_top_right():
     """Create a 200x200 image with the template in top-right quadrant."""
-    image = np.zeros((200, 200), dtype=np.uint8)
-    # Place match at (120, 20) - top-right quadrant
-    image[20:70, 120:170] = 255
-    image[30:60, 130:160] = 255
-    return image
+    # Match at (120, 20)
+    return read_only(shift_image(_BASE_IMAGE, 0, 100))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_image_with_match_bottom_right():
     """Create a 200x200 image with the template in bottom-right quadrant."""
-    image = np.zeros((200, 200), dtype=np.uint8)
-    # Place match at (120, 120) - bottom-right quadrant
-    image[120:170, 120:170] = 255
-    image[130:160, 130:160] = 255
-    return image
+    # Match at (120, 120)
+    return read_only(shift_image(_BASE_IMAGE, 100, 100))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def zero_canvas_200():
+    """Create a blank 200x200 canvas; tests draw on a copy."""
+    return read_only(np.zeros((200, 200), dtype=np.uint8))
+
+
+@pytest.fixture(scope="session")
 def simple_image_no_match():
     """Create a 200x200 image with no matching template."""
     image = np.zeros((200, 200), dtype=np.uint8)
     # Random noise, no clear match
     image[50:100, 50:100] = 128
-    return image
+    return read_only(image)
+
+
+# Session-scoped TM_CCOEFF_NORMED results, so each image is correlated once
+# for the whole suite.
+
+
+def scan_result(image, template):
+    """Run a TM_CCOEFF_NORMED scan and return its result."""
+    return MatchTemplateScan(image, template, "TM_CCOEFF_NORMED").result
+
+
+@pytest.fixture(scope="session")
+def no_match_result(simple_image_no_match, simple_template):
+    """Scan result for the image without a match."""
+    return scan_result(simple_image_no_match, simple_template)
+
+
+@pytest.fixture(scope="session")
+def bottom_left_result(simple_image_with_match_bottom_left, simple_template):
+    """Scan result for the image with a bottom-left match."""
+    return scan_result(simple_image_with_match_bottom_left, simple_template)
+
+
+@pytest.fixture(scope="session")
+def top_left_result(simple_image_with_match_top_left, simple_template):
+    """Scan result for the image with a top-left match."""
+    return scan_result(simple_image_with_match_top_left, simple_template)
+
+
+@pytest.fixture(scope="session")
+def top_right_result(simple_image_with_match_top_right, simple_template):
+    """Scan result for the image with a top-right match."""
+    return scan_result(simple_image_with_match_top_right, simple_template)
+
+
+@pytest.fixture(scope="session")
+def bottom_right_result(simple_image_with_match_bottom_right, simple_template):
+    """Scan result for the image with a bottom-right match."""
+    return scan_result(simple_image_with_match_bottom_right, simple_template)
+
+
+METHOD_NAMES = (
+    "TM_SQDIFF",
+    "TM_SQDIFF_NORMED",
+    "TM_CCORR",
+    "TM_CCORR_NORMED",
+    "TM_CCOEFF",
+    "TM_CCOEFF_NORMED",
+)
+
+
+@pytest.fixture(scope="session")
+def scanners_by_method(simple_image_no_match, simple_template):
+    """Map each method name to a scanner built once for the session.
+
+    Only for tests that read method configuration; they never run a match.
+    """
+    return {
+        name: MatchTemplateScan(simple_image_no_match, simple_template, name)
+        for name in METHOD_NAMES
+    }
 
 
-@pytest.fixture
+@pytest.fixture(
+    scope="module",
+    params=[name for name in METHOD_NAMES if name != "TM_CCOEFF_NORMED"],
+)
+def none_threshold_scanner(request, simple_image_no_match, simple_template):
+    """Build one scanner per method that has no default threshold."""
+    return MatchTemplateScan(simple_image_no_match, simple_template, request.param)
+
+
+@pytest.fixture(scope="session")
 def real_template():
-    """Load the actual template from loups/data/template_solid.png."""
-    template_path = (
-        Path(__file__).parent.parent / "loups" / "data" / "template_solid.png"
-    )
-    template = cv.imread(str(template_path), cv.IMREAD_GRAYSCALE)
+    """Load the actual template from loups/data/template_solid.png.
+
+    Decoded once per session and shared, so it is read-only.
+    """
+    resource = files("loups").joinpath("data/template_solid.png")
+    with as_file(resource) as template_path:
+        template = cv.imread(str(template_path), cv.IMREAD_GRAYSCALE)
     if template is None:
         pytest.skip(f"Template not found at {template_path}")
-    return template
+    return read_only(template)
 
 
 # ============================================================================
@@ -110,12 +200,24 @@ class TestMatchTemplateScanCore:
         assert scanner.template is simple_template
         assert scanner.method == "TM_CCOEFF_NORMED"
 
-    def test_result_structure(self, simple_image_no_match, simple_template):
+    def test_non_contiguous_and_mismatched_inputs_normalized(
+        self, simple_image_with_match_bottom_left, simple_template
+    ):
+        """Test that inputs are made contiguous and given a common dtype."""
+        # Fortran-ordered copy has the same content but is not C-contiguous
+        image = np.asfortranarray(simple_image_with_match_bottom_left)
+        assert not image.flags.c_contiguous
+        template = simple_template.astype(np.float64)
+
+        scanner = MatchTemplateScan(image, template, "TM_CCOEFF_NORMED")
+
+        assert scanner.image.flags.c_contiguous
+        assert scanner.image.dtype == scanner.template.dtype == np.float32
+        assert scanner.result.is_match is True
+
+    def test_result_structure(self, no_match_result):
         """Test that result returns a MatchTemplateResult."""
-        scanner = MatchTemplateScan(
-            simple_image_no_match, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = no_match_result
         assert isinstance(result, MatchTemplateResult)
         assert hasattr(result, "is_match")
         assert hasattr(result, "score")
@@ -152,36 +254,72 @@ class TestMatchTemplateScanCore:
         # Should be the exact same object (cached)
         assert match1 is match2
 
-    def test_result_composition_both_true(
-        self, simple_image_with_match_bottom_left, simple_template
+    def test_match_writes_into_result_buffer(
+        self, simple_image_no_match, simple_template
     ):
-        """Test result when both threshold and quadrant checks pass."""
+        """Test that a caller-supplied buffer receives the match scores."""
+        buffer = np.empty((151, 151), dtype=np.float32)
         scanner = MatchTemplateScan(
+            simple_image_no_match,
+            simple_template,
+            "TM_CCOEFF_NORMED",
+            result_buffer=buffer,
+        )
+
+        assert scanner.result_shape == (151, 151)
+        assert scanner.match is buffer
+
+    def test_scanners_do_not_share_results(
+        self,
+        simple_image_with_match_bottom_left,
+        simple_image_with_match_top_right,
+        simple_template,
+        bottom_left_result,
+    ):
+        """Test that scanning a same-sized image leaves earlier results intact."""
+        first = MatchTemplateScan(
             simple_image_with_match_bottom_left, simple_template, "TM_CCOEFF_NORMED"
         )
-        result = scanner.result
+        first_match = first.match.copy()
+
+        MatchTemplateScan(
+            simple_image_with_match_top_right, simple_template, "TM_CCOEFF_NORMED"
+        ).match
+
+        np.testing.assert_array_equal(first.match, first_match)
+        assert first.result == bottom_left_result
+
+    def test_coarse_scale_locates_same_match(
+        self, simple_image_with_match_top_left, simple_template, top_left_result
+    ):
+        """Test that the coarse-to-fine search lands within a pixel of full search."""
+        full = top_left_result
+        coarse = MatchTemplateScan(
+            simple_image_with_match_top_left,
+            simple_template,
+            "TM_CCOEFF_NORMED",
+            coarse_scale=4,
+        ).result
+
+        assert abs(coarse.top_left_point.x - full.top_left_point.x) <= 1
+        assert abs(coarse.top_left_point.y - full.top_left_point.y) <= 1
+        assert coarse.score == pytest.approx(full.score, abs=0.05)
+
+    def test_result_composition_both_true(self, bottom_left_result):
+        """Test result when both threshold and quadrant checks pass."""
+        result = bottom_left_result
         # Should match: good score AND in bottom-left quadrant
         assert result.is_match is True
 
-    def test_result_composition_threshold_false(
-        self, simple_image_no_match, simple_template
-    ):
+    def test_result_composition_threshold_false(self, no_match_result):
         """Test result when threshold check fails."""
-        scanner = MatchTemplateScan(
-            simple_image_no_match, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = no_match_result
         # Should not match: poor score
         assert result.is_match is False
 
-    def test_result_composition_quadrant_false(
-        self, simple_image_with_match_top_left, simple_template
-    ):
+    def test_result_composition_quadrant_false(self, top_left_result):
         """Test result when quadrant check fails but threshold passes."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_top_left, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = top_left_result
         # Should not match: wrong quadrant (even if good score)
         assert result.is_match is False
 
@@ -206,20 +344,15 @@ class TestMatchTemplateScanMethods:
         ],
     )
     def test_method_constants(
-        self, method_name, expected_cv_constant, simple_image_no_match, simple_template
+        self, method_name, expected_cv_constant, scanners_by_method
     ):
         """Test that all method names map to correct OpenCV constants."""
-        scanner = MatchTemplateScan(simple_image_no_match, simple_template, method_name)
+        scanner = scanners_by_method[method_name]
         assert scanner.method_attr == expected_cv_constant
 
-    def test_tm_ccoeff_normed_executes(
-        self, simple_image_with_match_bottom_left, simple_template
-    ):
+    def test_tm_ccoeff_normed_executes(self, bottom_left_result):
         """Test TM_CCOEFF_NORMED (only method with threshold) executes."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_bottom_left, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = bottom_left_result
         assert isinstance(result, MatchTemplateResult)
         assert isinstance(result.score, (int, float))
 
@@ -234,22 +367,23 @@ class TestMatchTemplateScanMethods:
         method_config = scanner.method_default["TM_CCOEFF_NORMED"]
         assert method_config.threshold == 0.53
 
-    @pytest.mark.parametrize(
-        "method_name",
-        [
-            "TM_SQDIFF",
-            "TM_SQDIFF_NORMED",
-            "TM_CCORR",
-            "TM_CCORR_NORMED",
-            "TM_CCOEFF",
-        ],
-    )
-    def test_other_methods_have_none_threshold(
-        self, method_name, simple_image_no_match, simple_template
+    def test_method_default_is_shared_and_read_only(
+        self, simple_image_no_match, simple_template
     ):
+        """Test that method defaults are one module-level read-only mapping."""
+        first = MatchTemplateScan(
+            simple_image_no_match, simple_template, "TM_CCOEFF_NORMED"
+        )
+        second = MatchTemplateScan(simple_image_no_match, simple_template, "TM_CCORR")
+
+        assert first.method_default is second.method_default
+        with pytest.raises(TypeError):
+            first.method_default["TM_CCORR"] = None
+
+    def test_other_methods_have_none_threshold(self, none_threshold_scanner):
         """Test that methods other than TM_CCOEFF_NORMED have None threshold."""
-        scanner = MatchTemplateScan(simple_image_no_match, simple_template, method_name)
-        method_config = scanner.method_default[method_name]
+        scanner = none_threshold_scanner
+        method_config = scanner.method_default[scanner.method]
         assert method_config.threshold is None
 
     @pytest.mark.parametrize(
@@ -264,10 +398,10 @@ class TestMatchTemplateScanMethods:
         ],
     )
     def test_optimal_function_mapping(
-        self, method_name, expected_optimal, simple_image_no_match, simple_template
+        self, method_name, expected_optimal, scanners_by_method
     ):
         """Test that each method has correct optimal_function (min vs max)."""
-        scanner = MatchTemplateScan(simple_image_no_match, simple_template, method_name)
+        scanner = scanners_by_method[method_name]
         method_config = scanner.method_default[method_name]
         assert method_config.optimal_function == expected_optimal
 
@@ -280,14 +414,9 @@ class TestMatchTemplateScanMethods:
 class TestMatchTemplateScanQuadrant:
     """Test quadrant detection logic."""
 
-    def test_match_in_bottom_left_quadrant(
-        self, simple_image_with_match_bottom_left, simple_template
-    ):
+    def test_match_in_bottom_left_quadrant(self, bottom_left_result, simple_template):
         """Test that matches in bottom-left quadrant are detected."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_bottom_left, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = bottom_left_result
         # Bottom-left quadrant should result in is_match=True (if threshold passes)
         # We know the match is strong enough, so check quadrant logic
         assert result.top_left_point.x < 100  # Left half
@@ -295,62 +424,42 @@ class TestMatchTemplateScanQuadrant:
         bottom_y = result.top_left_point.y + simple_template.shape[0]
         assert bottom_y > 100  # Bottom half
 
-    def test_match_in_top_left_quadrant_rejected(
-        self, simple_image_with_match_top_left, simple_template
-    ):
+    def test_match_in_top_left_quadrant_rejected(self, top_left_result):
         """Test that matches in top-left quadrant are rejected."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_top_left, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = top_left_result
         # Top-left quadrant should result in is_match=False
         assert result.is_match is False
 
-    def test_match_in_top_right_quadrant_rejected(
-        self, simple_image_with_match_top_right, simple_template
-    ):
+    def test_match_in_top_right_quadrant_rejected(self, top_right_result):
         """Test that matches in top-right quadrant are rejected."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_top_right, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = top_right_result
         # Top-right quadrant should result in is_match=False
         assert result.is_match is False
 
-    def test_match_in_bottom_right_quadrant_rejected(
-        self, simple_image_with_match_bottom_right, simple_template
-    ):
+    def test_match_in_bottom_right_quadrant_rejected(self, bottom_right_result):
         """Test that matches in bottom-right quadrant are rejected."""
-        scanner = MatchTemplateScan(
-            simple_image_with_match_bottom_right, simple_template, "TM_CCOEFF_NORMED"
-        )
-        result = scanner.result
+        result = bottom_right_result
         # Bottom-right quadrant should result in is_match=False
         assert result.is_match is False
 
-    def test_quadrant_boundary_horizontal(self):
+    def test_quadrant_boundary_horizontal(self, zero_canvas_200, simple_template):
         """Test match exactly on horizontal quadrant boundary."""
-        # Create image 200x200, template 50x50
-        # Use non-uniform template to avoid TM_CCOEFF_NORMED division by zero
-        template = np.zeros((50, 50), dtype=np.uint8)
-        template[10:40, 10:40] = 255  # White square pattern
-
-        image = np.zeros((200, 200), dtype=np.uint8)
+        # Non-uniform template avoids TM_CCOEFF_NORMED division by zero
+        image = zero_canvas_200.copy()
         # Template at (20, 50) means bottom at y=100 (exactly on boundary)
-        image[50:100, 20:70] = template
+        image[50:100, 20:70] = simple_template
 
-        scanner = MatchTemplateScan(image, template, "TM_CCOEFF_NORMED")
+        scanner = MatchTemplateScan(image, simple_template, "TM_CCOEFF_NORMED")
         result = scanner.result
         # Boundary uses >, so y=100 is NOT in bottom half
         # Should be rejected
         assert result.is_match is False
 
-    def test_quadrant_boundary_vertical(self):
+    def test_quadrant_boundary_vertical(self, zero_canvas_200):
         """Test match exactly on vertical quadrant boundary."""
-        # Create image 200x200, template 50x50
         # Place template so bottom-left is exactly at x=100 (boundary)
-        template = np.ones((50, 50), dtype=np.uint8) * 255
-        image = np.zeros((200, 200), dtype=np.uint8)
+        template = np.full((50, 50), 255, dtype=np.uint8)
+        image = zero_canvas_200.copy()
         # Template at (100, 120) means bottom-left at x=100 (exactly on boundary)
         image[120:170, 100:150] = 255
 
@@ -360,6 +469,24 @@ class TestMatchTemplateScanQuadrant:
         # Should be rejected
         assert result.is_match is False
 
+    @pytest.mark.parametrize(
+        "top_left, expected",
+        [
+            (Point(50, 30), True),  # x=50 < 50.5, bottom y=80 > 50.5
+            (Point(51, 30), False),  # x=51 is right of center
+            (Point(0, 0), False),  # bottom y=50 < 50.5
+            (Point(0, 1), True),  # bottom y=51 > 50.5
+        ],
+    )
+    def test_match_quadrant_odd_dimensions(self, top_left, expected):
+        """Test quadrant boundaries on an odd-sized image match the float math."""
+        image = np.zeros((101, 101), dtype=np.uint8)
+        template = np.zeros((50, 50), dtype=np.uint8)
+
+        scanner = MatchTemplateScan(image, template, "TM_CCOEFF_NORMED")
+
+        assert scanner.match_quadrant(top_left) is expected
+
 
 # ============================================================================
 # TestMatchTemplateScanEdgeCases - Edge Cases and Error Handling
@@ -471,40 +598,22 @@ class TestMatchTemplateScanEdgeCases:
         # Should work and match perfectly
         assert isinstance(result, MatchTemplateResult)
 
-    @pytest.mark.parametrize(
-        "method_name",
-        [
-            "TM_SQDIFF",
-            "TM_SQDIFF_NORMED",
-            "TM_CCORR",
-            "TM_CCORR_NORMED",
-            "TM_CCOEFF",
-        ],
-    )
-    def test_methods_with_none_threshold_raise_typeerror(self, method_name):
+    def test_methods_with_none_threshold_raise_typeerror(self, none_threshold_scanner):
         """Test that methods with None threshold cause TypeError when accessing result.
 
         This is a known limitation - only TM_CCOEFF_NORMED has a defined threshold.
         """
-        image = np.zeros((100, 100), dtype=np.uint8)
-        template = np.ones((50, 50), dtype=np.uint8) * 255
-
-        scanner = MatchTemplateScan(image, template, method_name)
-
         # Should raise TypeError when comparing None with number (>= or <=)
         with pytest.raises(TypeError):
-            _ = scanner.result
+            _ = none_threshold_scanner.result
 
-    def test_match_at_origin(self):
+    def test_match_at_origin(self, zero_canvas_200, simple_template):
         """Test match at coordinate (0, 0)."""
-        # Use non-uniform template to avoid TM_CCOEFF_NORMED division by zero
-        template = np.zeros((50, 50), dtype=np.uint8)
-        template[10:40, 10:40] = 255  # White square pattern
+        # Non-uniform template avoids TM_CCOEFF_NORMED division by zero
+        image = zero_canvas_200.copy()
+        image[0:50, 0:50] = simple_template
 
-        image = np.zeros((200, 200), dtype=np.uint8)
-        image[0:50, 0:50] = template
-
-        scanner = MatchTemplateScan(image, template, "TM_CCOEFF_NORMED")
+        scanner = MatchTemplateScan(image, simple_template, "TM_CCOEFF_NORMED")
         result = scanner.result
 
         # Match at (0, 0) is in top-left quadrant, should be rejected
@@ -556,19 +665,16 @@ class TestMatchTemplateScanRealData:
     def test_real_template_with_no_match(self, real_template):
         """Test real template against image with no match."""
         template_h, template_w = real_template.shape
-        image_h, image_w = template_h * 4, template_w * 4
 
-        # Create random noise image
-        image = np.random.randint(0, 256, (image_h, image_w), dtype=np.uint8)
+        # Seeded noise twice the template size keeps the outcome deterministic
+        rng = np.random.default_rng(0)
+        image = rng.integers(0, 256, (template_h * 2, template_w * 2), dtype=np.uint8)
 
         scanner = MatchTemplateScan(image, real_template, "TM_CCOEFF_NORMED")
         result = scanner.result
 
-        # Should not match (or if it does, score should be low)
-        # Random nature means we can't guarantee is_match=False
-        if result.is_match:
-            # If by chance it "matches", the score should still be relatively low
-            assert result.score < 0.8  # Not a strong match
+        assert result.is_match is False
+        assert result.score < 0.53  # Below the TM_CCOEFF_NORMED threshold
 
     def test_real_template_dimensions(self, real_template):
         """Test that real template has expected dimensions."""
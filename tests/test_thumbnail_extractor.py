@@ -8,13 +8,21 @@ import numpy as np
 import pytest
 
 from loups.thumbnail_extractor import (
+    NCC_PREFILTER_THRESHOLD,
+    TemplateStats,
     ThumbnailExtractor,
     ThumbnailResult,
+    calculate_ncc,
     calculate_ssim,
+    calculate_ssim_gray,
+    compute_template_stats,
     extract_thumbnail,
     generate_default_output_path,
     get_default_thumbnail_template,
+    is_flat_frame,
+    iter_sampled_frames,
     load_template,
+    prepare_frame,
 )
 
 
@@ -25,11 +33,9 @@ class TestThumbnailExtractor:
         """Test ThumbnailExtractor initialization."""
         # Create test video and template
         video_path = tmp_path / "test.mp4"
-        template_path = tmp_path / "template.png"
 
         # Create dummy template image
         template_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv.imwrite(str(template_path), template_img)
 
         # Mock VideoCapture
         with patch("cv2.VideoCapture") as mock_vc:
@@ -39,7 +45,7 @@ class TestThumbnailExtractor:
 
             extractor = ThumbnailExtractor(
                 video_path=video_path,
-                template_path=template_path,
+                template_path=template_img,
                 resolution=3,
                 scan_duration=120,
                 threshold=0.8,
@@ -54,11 +60,9 @@ class TestThumbnailExtractor:
     def test_frame_frequency(self, tmp_path):
         """Test frame_frequency method."""
         video_path = tmp_path / "test.mp4"
-        template_path = tmp_path / "template.png"
 
         # Create dummy template
         template_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv.imwrite(str(template_path), template_img)
 
         with patch("cv2.VideoCapture") as mock_vc:
             mock_capture = Mock()
@@ -67,13 +71,104 @@ class TestThumbnailExtractor:
 
             extractor = ThumbnailExtractor(
                 video_path=video_path,
-                template_path=template_path,
+                template_path=template_img,
                 resolution=3,
             )
 
             # 30 fps / 3 resolution = 10 (every 10th frame)
             assert extractor.frame_frequency() == 10
 
+    def test_context_manager_releases_capture(self, mock_template_image):
+        """Test that leaving the context releases the video capture."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_capture = Mock()
+            mock_capture.get.return_value = 30.0
+            mock_vc.return_value = mock_capture
+
+            with ThumbnailExtractor(
+                video_path=Path("dummy.mp4"), template_path=mock_template_image
+            ) as extractor:
+                assert extractor.capture is mock_capture
+                mock_capture.release.assert_not_called()
+
+            mock_capture.release.assert_called_once()
+
+    def test_frame_rate_read_once(self, mock_template_image):
+        """Test that FPS is queried at construction, not per frame_frequency call."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_capture = Mock()
+            mock_capture.get.return_value = 30.0
+            mock_vc.return_value = mock_capture
+
+            extractor = ThumbnailExtractor(
+                video_path=Path("dummy.mp4"), template_path=mock_template_image
+            )
+            for _ in range(3):
+                assert extractor.frame_frequency() == 10
+
+            mock_capture.get.assert_called_once_with(cv.CAP_PROP_FPS)
+
+    def test_capture_uses_default_backend(self, mock_template_image):
+        """Test that hardware decoding is not requested unless asked for."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_vc.return_value.get.return_value = 30.0
+
+            ThumbnailExtractor(
+                video_path=Path("dummy.mp4"), template_path=mock_template_image
+            )
+
+            mock_vc.assert_called_once_with("dummy.mp4")
+
+    def test_capture_requests_hw_acceleration(self, mock_template_image):
+        """Test that hw_accel opens the video with FFmpeg and hardware decoding."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_vc.return_value.get.return_value = 30.0
+
+            ThumbnailExtractor(
+                video_path=Path("dummy.mp4"),
+                template_path=mock_template_image,
+                hw_accel=True,
+            )
+
+            mock_vc.assert_called_once_with(
+                "dummy.mp4",
+                cv.CAP_FFMPEG,
+                [cv.CAP_PROP_HW_ACCELERATION, cv.VIDEO_ACCELERATION_ANY],
+            )
+
+    def test_capture_falls_back_to_default_backend(self, mock_template_image):
+        """Test that a capture FFmpeg cannot open is retried without options."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_vc.return_value.get.return_value = 30.0
+            mock_vc.return_value.isOpened.return_value = False
+
+            ThumbnailExtractor(
+                video_path=Path("dummy.mp4"),
+                template_path=mock_template_image,
+                hw_accel=True,
+            )
+
+            assert mock_vc.call_count == 2
+            mock_vc.assert_called_with("dummy.mp4")
+
+    def test_ssim_width_downscales_scan_template(self, mock_template_image):
+        """Test that ssim_width shrinks only the template used for scanning."""
+        with patch("cv2.VideoCapture") as mock_vc:
+            mock_vc.return_value.get.return_value = 30.0
+
+            full = ThumbnailExtractor(
+                video_path=Path("dummy.mp4"), template_path=mock_template_image
+            )
+            small = ThumbnailExtractor(
+                video_path=Path("dummy.mp4"),
+                template_path=mock_template_image,
+                ssim_width=50,
+            )
+
+            assert full.scan_stats is full.template_stats
+            assert small.template_stats.gray.shape == (100, 100)
+            assert small.scan_stats.gray.shape == (50, 50)
+
 
 class TestHelperFunctions:
     """Test helper functions."""
@@ -105,6 +200,35 @@ class TestHelperFunctions:
         assert loaded is not None
         assert isinstance(loaded, np.ndarray)
 
+    def test_load_template_grayscale_is_cached(self, mock_template_image):
+        """Test grayscale loading and that repeat loads reuse the decoded image."""
+        first = load_template(mock_template_image, grayscale=True)
+        second = load_template(mock_template_image, grayscale=True)
+
+        assert first.shape == (100, 100)
+        assert second is first
+        # Shared cached arrays must not be mutable by callers
+        assert not first.flags.writeable
+
+    def test_load_template_reduced(self, mock_template_image):
+        """Test that reduce downscales the template while decoding."""
+        color = load_template(mock_template_image, reduce=2)
+        gray = load_template(mock_template_image, grayscale=True, reduce=4)
+
+        assert color.shape == (50, 50, 3)
+        assert gray.shape == (25, 25)
+
+        with pytest.raises(ValueError, match="reduce"):
+            load_template(mock_template_image, reduce=3)
+
+    def test_load_template_from_array(self):
+        """Test that an in-memory template is used without touching disk."""
+        template_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+
+        assert load_template(template_img) is template_img
+        gray = load_template(template_img, grayscale=True, reduce=2)
+        assert gray.shape == (50, 50)
+
     def test_load_template_not_found(self, tmp_path):
         """Test loading non-existent template raises error."""
         # Test with explicit non-existent path
@@ -133,6 +257,16 @@ class TestHelperFunctions:
         # Identical images should have SSIM score of 1.0
         assert score == pytest.approx(1.0, abs=0.01)
 
+    def test_calculate_ssim_identical_skips_scoring(self):
+        """Test that identical images return 1.0 without the SSIM computation."""
+        img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+
+        with patch("loups.thumbnail_extractor.calculate_ssim_gray") as mock_gray:
+            score = calculate_ssim(img, img.copy())
+
+        assert score == 1.0
+        mock_gray.assert_not_called()
+
     def test_calculate_ssim_different(self):
         """Test SSIM calculation with different images."""
         # Create two different images
@@ -144,6 +278,141 @@ class TestHelperFunctions:
         # Different images should have low SSIM score
         assert score < 0.5
 
+    def test_calculate_ssim_with_template_stats(self):
+        """Test SSIM with precomputed template stats matches the raw template."""
+        frame = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        template = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+
+        stats = compute_template_stats(template)
+
+        assert isinstance(stats, TemplateStats)
+        assert stats.gray.shape == (100, 100)
+        assert calculate_ssim(frame, stats) == pytest.approx(
+            calculate_ssim(frame, template)
+        )
+
+    def test_calculate_ssim_gray_matches_calculate_ssim(self):
+        """Test that scoring a prepared frame equals scoring the raw frame."""
+        template = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        frame = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        stats = compute_template_stats(template)
+
+        score = calculate_ssim_gray(prepare_frame(frame, stats), stats)
+
+        assert isinstance(score, float)
+        assert score == pytest.approx(calculate_ssim(frame, stats), abs=1e-5)
+        assert calculate_ssim_gray(stats.gray, stats) == pytest.approx(1.0, abs=0.01)
+
+    def test_template_stats_use_uniform_sample_statistics(self):
+        """Test the 7x7 uniform mean and sample variance skimage uses by default."""
+        template = np.random.randint(0, 255, (50, 60), dtype=np.uint8)
+        stats = compute_template_stats(template)
+        gray_f32 = template.astype(np.float32)
+
+        mu = cv.blur(gray_f32, (7, 7))
+        variance = (cv.blur(gray_f32 * gray_f32, (7, 7)) - mu * mu) * 49 / 48
+
+        np.testing.assert_allclose(stats.mu, mu, rtol=1e-5)
+        np.testing.assert_allclose(stats.sigma_sq, variance, rtol=1e-3, atol=1e-2)
+
+    def test_calculate_ssim_gray_reuses_scratch(self):
+        """Test that a scratch dict keeps work arrays without changing scores."""
+        template = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        stats = compute_template_stats(template)
+        frames = [
+            prepare_frame(np.random.randint(0, 255, (100, 100, 3), np.uint8), stats)
+            for _ in range(2)
+        ]
+        scratch = {}
+
+        first = calculate_ssim_gray(frames[0], stats, scratch)
+        buffers = scratch[(100, 100)]
+        second = calculate_ssim_gray(frames[1], stats, scratch)
+
+        assert scratch[(100, 100)] is buffers
+        assert first == pytest.approx(calculate_ssim_gray(frames[0], stats))
+        assert second == pytest.approx(calculate_ssim_gray(frames[1], stats))
+
+    def test_prepare_frame_reuses_gray_buffer(self):
+        """Test that the grayscale intermediate is written into the given buffer."""
+        frame = np.random.randint(0, 255, (200, 200, 3), dtype=np.uint8)
+        stats = compute_template_stats(np.zeros((100, 100), dtype=np.uint8))
+        gray_buffer = np.empty((200, 200), dtype=np.uint8)
+
+        prepared = prepare_frame(frame, stats, gray_buffer)
+
+        np.testing.assert_array_equal(
+            gray_buffer, cv.cvtColor(frame, cv.COLOR_BGR2GRAY)
+        )
+        np.testing.assert_array_equal(prepared, prepare_frame(frame, stats))
+
+    def test_calculate_ncc_identical(self):
+        """Test NCC of a frame against itself is 1.0."""
+        img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        stats = compute_template_stats(img)
+
+        ncc = calculate_ncc(prepare_frame(img, stats), stats)
+
+        assert ncc == pytest.approx(1.0, abs=0.01)
+
+    def test_is_flat_frame(self):
+        """Test flat-frame detection on uniform and noisy images."""
+        flat = np.full((100, 100), 40, dtype=np.uint8)
+        noisy = np.random.randint(0, 255, (100, 100), dtype=np.uint8)
+
+        assert is_flat_frame(flat)
+        assert not is_flat_frame(noisy)
+
+
+class TestIterSampledFrames:
+    """Test the background decode pipeline."""
+
+    def test_yields_every_nth_frame(self, black_frame):
+        """Test that only sampled frames are retrieved and yielded in order."""
+        mock_capture = Mock()
+        mock_capture.grab.side_effect = [True] * 9 + [False]
+        mock_capture.retrieve.return_value = (True, black_frame)
+        mock_capture.get.return_value = 100.0
+
+        frames = list(iter_sampled_frames(mock_capture, 100, 3))
+
+        assert [frame_number for frame_number, _, _ in frames] == [3, 6, 9]
+        assert mock_capture.retrieve.call_count == 3
+
+    def test_seek_reads_only_sampled_frames(self, black_frame):
+        """Test that seek mode jumps to each sampled frame instead of grabbing."""
+        mock_capture = Mock()
+        mock_capture.read.return_value = (True, black_frame)
+        mock_capture.get.return_value = 0.0
+
+        frames = list(iter_sampled_frames(mock_capture, 9, 3, seek=True))
+
+        assert [frame_number for frame_number, _, _ in frames] == [3, 6, 9]
+        mock_capture.grab.assert_not_called()
+        seek_targets = [c.args[1] for c in mock_capture.set.call_args_list]
+        assert seek_targets == [2, 5, 8]
+
+    def test_early_close_stops_producer(self, black_frame):
+        """Test that closing the iterator stops decoding without hanging."""
+        mock_capture = Mock()
+        mock_capture.grab.return_value = True
+        mock_capture.retrieve.return_value = (True, black_frame)
+        mock_capture.get.return_value = 0.0
+
+        sampled_frames = iter_sampled_frames(mock_capture, 10_000, 1, queue_size=2)
+        assert next(sampled_frames)[0] == 1
+        sampled_frames.close()
+
+        assert mock_capture.grab.call_count < 10_000
+
+    def test_producer_error_is_reraised(self):
+        """Test that decode errors surface in the consuming thread."""
+        mock_capture = Mock()
+        mock_capture.grab.side_effect = RuntimeError("decode failed")
+
+        with pytest.raises(RuntimeError, match="decode failed"):
+            list(iter_sampled_frames(mock_capture, 10, 1))
+
 
 class TestExtractThumbnail:
     """Test extract_thumbnail function."""
@@ -151,12 +420,10 @@ class TestExtractThumbnail:
     def test_extract_thumbnail_success(self, tmp_path):
         """Test successful thumbnail extraction."""
         video_path = tmp_path / "test.mp4"
-        template_path = tmp_path / "template.png"
         output_path = tmp_path / "output.jpg"
 
         # Create dummy template
         template_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv.imwrite(str(template_path), template_img)
 
         # Mock VideoCapture to simulate video frames
         with patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc:
@@ -181,7 +448,7 @@ class TestExtractThumbnail:
             # Use resolution=30 so frame_interval = 1 (check every frame)
             result = extract_thumbnail(
                 video_path=video_path,
-                template_path=template_path,
+                template_path=template_img,
                 output_path=output_path,
                 threshold=0.9,
                 scan_duration=10,
@@ -192,15 +459,44 @@ class TestExtractThumbnail:
             assert isinstance(result, ThumbnailResult)
             assert result.success is True
             assert result.output_path == output_path
+            mock_capture.release.assert_called_once()
+
+    def test_extract_thumbnail_downscaled_confirms_full_size(self, tmp_path):
+        """Test that a downscaled candidate is rescored at full size."""
+        output_path = tmp_path / "output.jpg"
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+
+        with (
+            patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc,
+            patch(
+                "loups.thumbnail_extractor.calculate_ssim", return_value=0.95
+            ) as mock_full,
+        ):
+            mock_capture = mock_vc.return_value
+            mock_capture.get.side_effect = [30.0, 1000.0]
+            mock_capture.grab.side_effect = [True, False]
+            mock_capture.retrieve.return_value = (True, frame)
+
+            result = extract_thumbnail(
+                video_path=tmp_path / "test.mp4",
+                template_path=frame,
+                output_path=output_path,
+                threshold=0.9,
+                scan_duration=10,
+                resolution=30,
+                ssim_width=50,
+            )
+
+        mock_full.assert_called_once()
+        assert result.success is True
+        assert result.ssim_score == 0.95
 
     def test_extract_thumbnail_no_match(self, tmp_path):
         """Test thumbnail extraction when no frame exceeds threshold."""
         video_path = tmp_path / "test.mp4"
-        template_path = tmp_path / "template.png"
 
         # Create template (black image)
         template_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv.imwrite(str(template_path), template_img)
 
         with patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc:
             mock_capture = Mock()
@@ -218,7 +514,7 @@ class TestExtractThumbnail:
             # Extract with high threshold (won't match)
             result = extract_thumbnail(
                 video_path=video_path,
-                template_path=template_path,
+                template_path=template_img,
                 threshold=0.9,  # High threshold won't match different images
                 scan_duration=1,
                 resolution=30,  # 30 fps / 30 resolution = interval of 1
@@ -230,11 +526,9 @@ class TestExtractThumbnail:
     def test_extract_thumbnail_default_output_path(self, tmp_path):
         """Test that default output path is generated correctly."""
         video_path = tmp_path / "mygame.mp4"
-        template_path = tmp_path / "template.png"
 
         # Create template
         template_img = np.zeros((100, 100, 3), dtype=np.uint8)
-        cv.imwrite(str(template_path), template_img)
 
         with (
             patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc,
@@ -249,7 +543,7 @@ class TestExtractThumbnail:
 
             result = extract_thumbnail(
                 video_path=video_path,
-                template_path=template_path,
+                template_path=template_img,
                 output_path=None,  # No output path specified
                 threshold=0.9,
                 scan_duration=1,
@@ -259,3 +553,61 @@ class TestExtractThumbnail:
             assert result is not None
             # Default path should be <video>-thumbnail.jpg in cwd
             assert result.output_path == tmp_path / "mygame-thumbnail.jpg"
+
+    def test_extract_thumbnail_prefilter_skips_ssim(self, tmp_path):
+        """Test that frames failing the NCC prefilter are never SSIM-scored."""
+        video_path = tmp_path / "test.mp4"
+
+        # Structured template; frames are its negative (NCC = -1)
+        template_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        inverted_frame = 255 - template_img
+
+        with (
+            patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc,
+            patch("loups.thumbnail_extractor.calculate_ssim_gray") as mock_ssim,
+        ):
+            mock_capture = Mock()
+            mock_capture.get.return_value = 30.0
+            mock_capture.grab.side_effect = [True] * 5 + [False]
+            mock_capture.retrieve.return_value = (True, inverted_frame)
+            mock_vc.return_value = mock_capture
+
+            result = extract_thumbnail(
+                video_path=video_path,
+                template_path=template_img,
+                threshold=0.35,
+                scan_duration=1,
+                resolution=30,
+                prefilter_threshold=NCC_PREFILTER_THRESHOLD,
+            )
+
+            assert result is None
+            mock_ssim.assert_not_called()
+
+    def test_extract_thumbnail_prefilter_is_opt_in(self, tmp_path):
+        """Test that without a prefilter threshold every frame is SSIM-scored."""
+        template_img = np.random.randint(0, 255, (100, 100, 3), dtype=np.uint8)
+        inverted_frame = 255 - template_img
+
+        with (
+            patch("loups.thumbnail_extractor.cv.VideoCapture") as mock_vc,
+            patch(
+                "loups.thumbnail_extractor.calculate_ssim_gray", return_value=0.0
+            ) as mock_ssim,
+        ):
+            mock_capture = Mock()
+            mock_capture.get.return_value = 30.0
+            mock_capture.grab.side_effect = [True] * 5 + [False]
+            mock_capture.retrieve.return_value = (True, inverted_frame)
+            mock_vc.return_value = mock_capture
+
+            result = extract_thumbnail(
+                video_path=tmp_path / "test.mp4",
+                template_path=template_img,
+                threshold=0.35,
+                scan_duration=1,
+                resolution=30,
+            )
+
+            assert result is None
+            assert mock_ssim.call_count == 5